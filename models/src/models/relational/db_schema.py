@@ -2,12 +2,8 @@
 Structure de base d'un modèle relationnel de données.
 
 - Classes:
-    - Database: Base de données.
-    - SQLite: Base de données SQLite.
-    - PostgreSQL: Base de données PostgreSQL.
-    - MySQL: Base de données MySQL.
-    - OracleDB: Base de données Oracle.
-    - SQLServer: Base de données SQL Server.
+    - Database: Base de données (alias : SQLite, PostgreSQL, MySQL, OracleDB,
+      SQLServer).
     - Table: Table de la base de données.
     - Column: Colonne d'une table.
     - ForeignKeyColumn: Colonne de clé étrangère.
@@ -15,10 +11,14 @@ Structure de base d'un modèle relationnel de données.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any, Generic, TypeVar, Type, cast, Sequence
-from abc import ABC, abstractmethod
+from sys import intern
+from typing import Any, Generic, TypeVar, Type, Sequence
+import asyncio
 import json
+import threading
+from operator import attrgetter
 
 from models.relational.orm import ORM
 from models.relational.config import DbConfig, DataBaseType
@@ -39,21 +39,35 @@ FOREIGNKEY_COLUMN_ORM_TYPE = TypeVar(
     "FOREIGNKEY_COLUMN_ORM_TYPE", bound=ORM.ForeignKeyColumn
 )
 
+# Lecture en un seul appel des champs de `ColumnMeta` recopiés par `Column`.
+_COLUMN_META_FIELDS = attrgetter(
+    "type", "length", "nullable", "primary_key", "default", "unique"
+)
+
 
-class Database(Generic[ORM_TYPE, TABLE_ORM_TYPE], ABC):
+class Database(Generic[ORM_TYPE, TABLE_ORM_TYPE]):
     """
-    Classe abstraite représentant une base de données.
+    Représente une base de données.
 
     :param _name: Nom de la base de données.
     :param _type: Type de la base de données.
-    :param _orm: Couche ORM de la base de données.
-    :param tables: Tables de la base de données.
+    :param _orm: Instance de la couche ORM.
+    :param tables: Tables de la base de données (vue en lecture seule de la
+        couche ORM).
+    :param schema_lock: Verrou des modifications du schéma, partagé par les
+        tables : les métadonnées et le cache de la couche ORM ne sont modifiés
+        que par un fil d'exécution à la fois.
+
+    Les tables de la couche ORM ne sont mises en cache qu'à un seul endroit : la
+    couche ORM elle-même (`ORM._prereflected`), que `invalidate` vide en relisant
+    le schéma.
     """
 
     _name: str
     _type: DataBaseType
     _orm: ORM_TYPE
-    tables: dict[str, Type[TABLE_ORM_TYPE]]
+    tables: Mapping[str, TABLE_ORM_TYPE]
+    schema_lock: threading.RLock
     _schema: str | None = None
 
     def __init__(self, db_config: DbConfig | Path, orm_class_: Type[ORM_TYPE]) -> None:
@@ -78,6 +92,7 @@ class Database(Generic[ORM_TYPE, TABLE_ORM_TYPE], ABC):
                 raise ValueError("Le type de base de données n'est pas supporté.")
         else:
             raise ValueError("La configuration de la base de données est invalide.")
+        self.schema_lock = threading.RLock()
         self._orm = orm_class_(engine_url, self._schema)
         self._get_orm_tables()
 
@@ -95,29 +110,70 @@ class Database(Generic[ORM_TYPE, TABLE_ORM_TYPE], ABC):
         """Déconnecte de la base de données."""
         self._orm.close_session()
 
-    def get_orm_table(self, table_name: str) -> Type[TABLE_ORM_TYPE]:
+    def get_orm_table(self, table_name: str) -> TABLE_ORM_TYPE:
         """
         Récupère une table du type de la couche ORM.
 
+        La table est mise en cache par la couche ORM jusqu'à la prochaine
+        requête DDL qui la concerne ou jusqu'à son invalidation (voir
+        `invalidate`).
+
         :param table_name: Nom de la table.
         :return: Table.
         """
         try:
-            return cast(Type[TABLE_ORM_TYPE], self._orm.get_table(table_name))
-        except self._orm.NoSuchTableError as e:
-            raise self._orm.NoSuchTableError(e) from e
+            return self._orm.get_table(table_name)  # type: ignore[return-value]
         except Exception as e:
+            if isinstance(e, self._orm.NoSuchTableError):
+                raise
             raise Exception(f"Impossible de récupérer la table {table_name}.") from e
 
+    def invalidate(self, table_name: str | None = None) -> None:
+        """
+        Relit le schéma d'une table, ou de toute la base, dans la base de
+        données, par exemple après une modification du schéma faite hors de
+        cette instance.
+
+        :param table_name: Nom de la table à relire. `None` : toutes les
+            tables.
+        """
+        with self.schema_lock:
+            if table_name is None:
+                self._orm.refresh_metadata()
+            else:
+                self._orm.refresh_metadata(table_name)
+
+    def has_table(self, table_name: str) -> bool:
+        """
+        Vérifie si une table existe dans la base de données.
+
+        :param table_name: Nom de la table.
+        :return: Vrai si la table existe, faux sinon.
+        """
+        return self._orm.has_table(table_name)
+
+    def prefetch(self, table_names: list[str]) -> None:
+        """
+        Précharge en une seule réflexion plusieurs tables de la couche ORM.
+
+        Les appels suivants à `get_orm_table` pour ces tables ne déclenchent
+        plus d'accès à la base de données.
+
+        :param table_names: Noms des tables à précharger.
+        """
+        try:
+            self._orm.reflect_many(table_names)
+        except Exception as e:
+            raise Exception(
+                f"Impossible de précharger les tables {', '.join(table_names)}."
+            ) from e
+
     def _get_orm_tables(self) -> None:
         """
         Récupère les tables du type de la couche ORM.
         """
         try:
-            self.tables = {
-                table_name: cast(Type[TABLE_ORM_TYPE], table)
-                for table_name, table in self._orm.get_tables().items()
-            }
+            self.tables = self._orm.get_tables()  # type: ignore[assignment]
         except Exception as e:
             raise Exception("Impossible de récupérer les tables.") from e
 
@@ -125,6 +181,7 @@ class Database(Generic[ORM_TYPE, TABLE_ORM_TYPE], ABC):
         """
         Rafraîchit les tables de la base de données.
         """
+        self.invalidate()
         self._get_orm_tables()
 
     def create_orm_table(
@@ -132,7 +189,7 @@ class Database(Generic[ORM_TYPE, TABLE_ORM_TYPE], ABC):
         table_name: str,
         columns: list[ColumnMeta | ForeignKeyColumnMeta],
         unique_constraints_columns: list[UniqueColumnsMeta] | None = None,
-    ) -> Type[TABLE_ORM_TYPE]:
+    ) -> TABLE_ORM_TYPE:
         """
         Récupère ou crée une table du type de la couche ORM.
         :param table_name: Nom de la table.
@@ -142,28 +199,39 @@ class Database(Generic[ORM_TYPE, TABLE_ORM_TYPE], ABC):
         """
 
         try:
-            table = cast(
-                Type[TABLE_ORM_TYPE],
-                self._orm.create_table(table_name, columns, unique_constraints_columns),
+            table: TABLE_ORM_TYPE = self._orm.create_table(  # type: ignore[assignment]
+                table_name, columns, unique_constraints_columns
             )
-            self.tables[table_name] = table
             return table
-        except self._orm.CreateTableError as e:
-            raise self._orm.CreateTableError(e) from e
         except Exception as e:
+            if isinstance(e, self._orm.CreateTableError):
+                raise
             raise Exception(
                 f"Impossible de récupérer ou créer la table {table_name}."
             ) from e
 
-    @abstractmethod
     def execute(self, query: str) -> Any:
         """
-        Exécute une requête sur la base de données.
+        Exécute une requête sur la base de données avec la couche ORM.
 
         :param query: Requête à exécuter.
-        :return: Résultat de la requête.
+        :return: Lignes retournées par la requête.
+        """
+        return self._orm.execute_query(query)
+
+    async def execute_many(self, queries: list[str]) -> list[Any]:
         """
-        pass
+        Exécute un lot de requêtes sur la base de données.
+
+        Les requêtes sont exécutées dans l'ordre, sur une même connexion et dans
+        une seule transaction, dans un fil d'exécution : la boucle d'événements
+        n'est pas bloquée, et une erreur annule tout le lot.
+
+        :param queries: Requêtes à exécuter.
+        :return: Lignes retournées par chaque requête, dans l'ordre des
+            requêtes.
+        """
+        return list(await asyncio.to_thread(self._orm.execute_queries, queries))
 
     def get_schema(self) -> DatabaseMetaDict:
         """
@@ -181,7 +249,7 @@ class Database(Generic[ORM_TYPE, TABLE_ORM_TYPE], ABC):
                     "name": table_name,
                     "columns": {
                         column.meta.name: column.meta.get_dict()
-                        for column in table.columns
+                        for column in table.columns.values()
                     },
                     "unique_columns": {
                         unique.name: unique.columns
@@ -202,123 +270,9 @@ class Database(Generic[ORM_TYPE, TABLE_ORM_TYPE], ABC):
             json.dump(self.get_schema(), file, indent=4)
 
 
-class SQLite(Database[ORM_TYPE, TABLE_ORM_TYPE]):
-    """
-    Représente une base de données SQLite.
-    """
-
-    def __init__(self, db_config: Path, orm_class_: Type[ORM_TYPE]) -> None:
-        """
-        Constructeur de la base de données SQLite.
-
-        :param db_config: Configuration de la base de données.
-        :param orm_class_: Classe de la couche ORM.
-        """
-        super().__init__(db_config, orm_class_)
-
-    def execute(self, query: str) -> Any:
-        """
-        Exécute une requête sur la base de données SQLite.
-
-        :param query: Requête à exécuter.
-        :return: Résultat de la requête.
-        """
-        pass
-
-
-class PostgreSQL(Database[ORM_TYPE, TABLE_ORM_TYPE]):
-    """
-    Représente une base de données PostgreSQL.
-    """
-
-    def __init__(self, db_config: DbConfig, orm_class_: Type[ORM_TYPE]) -> None:
-        """
-        Constructeur de la base de données PostgreSQL.
-
-        :param db_config: Configuration de la base de données.
-        :param orm_class_: Classe de la couche ORM.
-        """
-        super().__init__(db_config, orm_class_)
-
-    def execute(self, query: str) -> Any:
-        """
-        Exécute une requête sur la base de données PostgreSQL.
-
-        :param query: Requête à exécuter.
-        :return: Résultat de la requête.
-        """
-        pass
-
-
-class MySQL(Database[ORM_TYPE, TABLE_ORM_TYPE]):
-    """
-    Représente une base de données MySQL.
-    """
-
-    def __init__(self, db_config: DbConfig, orm_class_: Type[ORM_TYPE]) -> None:
-        """
-        Constructeur de la base de données MySQL.
-
-        :param db_config: Configuration de la base de données.
-        :param orm_class_: Classe de la couche ORM.
-        """
-        super().__init__(db_config, orm_class_)
-
-    def execute(self, query: str) -> Any:
-        """
-        Exécute une requête sur la base de données MySQL.
-
-        :param query: Requête à exécuter.
-        :return: Résultat de la requête.
-        """
-        pass
-
-
-class OracleDB(Database[ORM_TYPE, TABLE_ORM_TYPE]):
-    """
-    Représente une base de données Oracle.
-    """
-
-    def __init__(self, db_config: DbConfig, orm_class_: Type[ORM_TYPE]) -> None:
-        """
-        Constructeur de la base de données Oracle.
-
-        :param db_config: Configuration de la base de données.
-        :param orm_class_: Classe de la couche ORM.
-        """
-        super().__init__(db_config, orm_class_)
-
-    def execute(self, query: str) -> Any:
-        """
-        Exécute une requête sur la base de données Oracle.
-
-        :param query: Requête à exécuter.
-        :return: Résultat de la requête.
-        """
-        pass
-
-
-class SQLServer(Database[ORM_TYPE, TABLE_ORM_TYPE]):
-    """
-    Représente une base de données SQL Server.
-    """
-
-    def __init__(self, db_config: DbConfig, orm_class_: Type[ORM_TYPE]) -> None:
-        """
-        Constructeur de la base de données SQL Server.
-
-        :param db_config: Configuration de la base de données.
-        """
-        super().__init__(db_config, orm_class_)
-
-    def execute(self, query: str) -> Any:
-        """
-        Exécute une requête sur la base de données SQL Server.
-
-        :param query: Requête à exécuter.
-        :return: Résultat de la requête.
-        """
-        pass
+# Alias conservés pour les appelants qui utilisent les noms par SGBD : le type
+# de base de données est porté par la configuration.
+SQLite = PostgreSQL = MySQL = OracleDB = SQLServer = Database
 
 
 class Table(
@@ -331,19 +285,31 @@ class Table(
     :param database: Base de données à laquelle appartient la table.
     :param columns: Colonnes de la table.
     :param unique_contraints_columns: Liste des contraintes d'unicité.
+
+    Les noms `vb_name` et `db_name` sont internés (`sys.intern`) : deux noms
+    égaux sont le même objet, ce qui permet un test `is` avant `==`.
+
+    Les métadonnées des colonnes sont conservées par position (`_metas`), avec
+    la position de la clé primaire et celle de chaque nom ; les objets `Column`
+    ne sont construits qu'au premier accès à chaque colonne.
     """
 
     _db_name: str
     vb_name: str
     database: Database[ORM_TYPE, TABLE_ORM_TYPE]
-    _columns: list[
+    _metas: tuple[ColumnMeta | ForeignKeyColumnMeta, ...]
+    _pk_idx: int | None
+    _by_name: dict[str, int]
+    _column_views: list[
         Column[ORM_TYPE, TABLE_ORM_TYPE, COLUMN_ORM_TYPE, FOREIGNKEY_COLUMN_ORM_TYPE]
         | ForeignKeyColumn[
             ORM_TYPE, TABLE_ORM_TYPE, COLUMN_ORM_TYPE, FOREIGNKEY_COLUMN_ORM_TYPE
         ]
+        | None
     ]
     _unique_constraints_columns: list[UniqueConstraint]
-    link_table: Type[TABLE_ORM_TYPE]
+    link_table: TABLE_ORM_TYPE
+    _str: str | None = None
 
     def __init__(
         self,
@@ -351,6 +317,7 @@ class Table(
         database: Database[ORM_TYPE, TABLE_ORM_TYPE],
         columns: list[ColumnMeta | ForeignKeyColumnMeta] | None = None,
         unique_constraints_columns: list[UniqueColumnsMeta] | None = None,
+        orm_table: TABLE_ORM_TYPE | None = None,
     ) -> None:
         """
         Constructeur de la table.
@@ -359,53 +326,42 @@ class Table(
         :param database: Base de données à laquelle appartient la table.
         :param columns: Colonnes de la table.
         :param unique_constraints_columns: Contraintes d'unicité.
+        :param orm_table: Table de la couche ORM déjà chargée (évite sa récupération).
         """
 
         try:
-            if columns is not None:
-                if name in database.tables:
-                    table = database.tables[name]
-                else:
-                    table = database.create_orm_table(
-                        name, columns, unique_constraints_columns
-                    )
-            else:
+            if orm_table is not None:
+                table = orm_table
+            elif database.has_table(name):
                 table = database.get_orm_table(name)
-            self._db_name = table.name  # type: ignore
-            self.vb_name = name
+            elif columns is not None:
+                table = database.create_orm_table(
+                    name, columns, unique_constraints_columns
+                )
+            else:
+                raise database._orm.NoSuchTableError(f"La table {name} n'existe pas.")
+            self._db_name = intern(str(table.name))
+            self.vb_name = intern(name)
             self.database = database
             self._link_table = table
-            self._columns = [
-                (
-                    ForeignKeyColumn[
-                        ORM_TYPE,
-                        TABLE_ORM_TYPE,
-                        COLUMN_ORM_TYPE,
-                        FOREIGNKEY_COLUMN_ORM_TYPE,
-                    ](column.meta, self)
-                    if isinstance(column.meta, ForeignKeyColumnMeta)
-                    else Column[
-                        ORM_TYPE,
-                        TABLE_ORM_TYPE,
-                        COLUMN_ORM_TYPE,
-                        FOREIGNKEY_COLUMN_ORM_TYPE,
-                    ](column.meta, self)
-                )
-                for column in table.columns
-            ]
+            self._set_metas()
             self._unique_constraints_columns = [
                 UniqueConstraint(unique, self) for unique in table.unique_constraints
             ]
-        except database._orm.NoSuchTableError as e:
-            raise database._orm.NoSuchTableError(e) from e
-        except database._orm.CreateTableError as e:
-            raise database._orm.CreateTableError(e) from e
         except Exception as e:
+            if isinstance(
+                e, (database._orm.NoSuchTableError, database._orm.CreateTableError)
+            ):
+                raise
             raise Exception(f"Erreur lors de la création de la table {name}.") from e
 
     def __str__(self) -> str:
-        """Retourne une représentation de la table."""
-        return f"Table {self.vb_name} de la base de données {self.database.name}"
+        """Retourne une représentation de la table (calculée une seule fois)."""
+        if self._str is None:
+            self._str = (
+                f"Table {self.vb_name} de la base de données {self.database.name}"
+            )
+        return self._str
 
     @property
     def name(self) -> str:
@@ -421,9 +377,8 @@ class Table(
 
         :return: Colonne clé primaire.
         """
-        for column in self._columns:
-            if column.primary_key:
-                return column
+        if self._pk_idx is not None:
+            return self._column_at(self._pk_idx)
         raise ValueError(
             f"Aucune colonne clé primaire n'existe dans la table {self.vb_name}."
         )
@@ -438,7 +393,7 @@ class Table(
         ]
     ]:
         """Retourne les colonnes de la table."""
-        return self._columns
+        return [self._column_at(index) for index in range(len(self._metas))]
 
     @property
     def unique_columns(self) -> list[UniqueConstraint]:
@@ -456,23 +411,23 @@ class Table(
         Modifie le nom de la table dans la base de données.
         :param name: Nom de la table.
         """
-        self._link_table.name = name  # type: ignore
+        self._link_table.name = name
         self._link_table = self.database.get_orm_table(name)
-        self._db_name = name
+        self._db_name = intern(name)
 
     def refresh(self) -> None:
         """
-        Rafraîchit les données de la table.
+        Relit la table dans la base de données.
         """
-        self._link_table = self.database.get_orm_table(self.vb_name)
-        self._columns = [
-            (
-                ForeignKeyColumn(column.meta, self)
-                if isinstance(column.meta, ForeignKeyColumnMeta)
-                else Column(column.meta, self)
-            )
-            for column in self._link_table.columns
-        ]
+        self.database.invalidate(self._db_name)
+        self._reload()
+
+    def _reload(self) -> None:
+        """
+        Recharge la table depuis la couche ORM, sans relire la base de données.
+        """
+        self._link_table = self.database.get_orm_table(self._db_name)
+        self._set_metas()
         self._unique_constraints_columns = [
             UniqueConstraint(unique, self)
             for unique in self._link_table.unique_constraints
@@ -492,12 +447,61 @@ class Table(
         :param column_name: Nom de la colonne.
         :return: Colonne.
         """
-        for column in self._columns:
-            if column.name == column_name:
-                return column
-        raise ValueError(
-            f"La colonne {column_name} n'existe pas dans la table {self.vb_name}."
+        index = self._by_name.get(column_name)
+        if index is None:
+            raise ValueError(
+                f"La colonne {column_name} n'existe pas dans la table {self.vb_name}."
+            )
+        return self._column_at(index)
+
+    def _set_metas(self) -> None:
+        """
+        Lit les métadonnées des colonnes dans la table de la couche ORM.
+        """
+        self._metas = tuple(column.meta for column in self._link_table.columns.values())
+        self._pk_idx = next(
+            (index for index, meta in enumerate(self._metas) if meta.primary_key),
+            None,
         )
+        self._by_name = {
+            intern(str(meta.name)): index for index, meta in enumerate(self._metas)
+        }
+        self._column_views = [None] * len(self._metas)
+
+    def _column_at(
+        self, index: int
+    ) -> (
+        Column[ORM_TYPE, TABLE_ORM_TYPE, COLUMN_ORM_TYPE, FOREIGNKEY_COLUMN_ORM_TYPE]
+        | ForeignKeyColumn[
+            ORM_TYPE, TABLE_ORM_TYPE, COLUMN_ORM_TYPE, FOREIGNKEY_COLUMN_ORM_TYPE
+        ]
+    ):
+        """
+        Retourne la colonne à une position donnée, construite au premier accès.
+
+        :param index: Position de la colonne.
+        :return: Colonne.
+        """
+        column = self._column_views[index]
+        if column is None:
+            meta = self._metas[index]
+            column = (
+                ForeignKeyColumn[
+                    ORM_TYPE,
+                    TABLE_ORM_TYPE,
+                    COLUMN_ORM_TYPE,
+                    FOREIGNKEY_COLUMN_ORM_TYPE,
+                ](meta, self)
+                if isinstance(meta, ForeignKeyColumnMeta)
+                else Column[
+                    ORM_TYPE,
+                    TABLE_ORM_TYPE,
+                    COLUMN_ORM_TYPE,
+                    FOREIGNKEY_COLUMN_ORM_TYPE,
+                ](meta, self)
+            )
+            self._column_views[index] = column
+        return column
 
     def add_column(
         self, column_meta: ColumnMeta | ForeignKeyColumnMeta
@@ -510,13 +514,16 @@ class Table(
         """
         Ajoute une colonne à la table.
 
+        L'ajout prend le verrou du schéma de la base de données
+        (`Database.schema_lock`) : des ajouts faits depuis plusieurs fils
+        d'exécution sont exécutés l'un après l'autre.
+
         :param column: Métadonnées de la colonne.
         :return: Colonne.
         """
-        column_orm_meta = cast(
-            Type[COLUMN_ORM_TYPE | FOREIGNKEY_COLUMN_ORM_TYPE], self._link_table.add_column(column_meta)  # type: ignore
-        ).meta
-        self.refresh()
+        with self.database.schema_lock:
+            column_orm_meta = self._link_table.add_column(column_meta).meta
+            self._reload()
         column = (
             ForeignKeyColumn(meta_data=column_orm_meta, table=self)
             if isinstance(column_orm_meta, ForeignKeyColumnMeta)
@@ -539,6 +546,9 @@ class Column(
     :param default: Valeur par défaut de la colonne.
     :param unique: Indique si la colonne est unique.
     :param table: Table à laquelle appartient la colonne.
+
+    Le nom de la colonne est interné (`sys.intern`) : deux noms égaux sont le
+    même objet, ce qui permet un test `is` avant `==`.
     """
 
     _name: str
@@ -549,7 +559,8 @@ class Column(
     default: Any | None
     unique: bool
     table: Table[ORM_TYPE, TABLE_ORM_TYPE, COLUMN_ORM_TYPE, FOREIGNKEY_COLUMN_ORM_TYPE]
-    link_column: Type[COLUMN_ORM_TYPE | FOREIGNKEY_COLUMN_ORM_TYPE]
+    link_column: COLUMN_ORM_TYPE | FOREIGNKEY_COLUMN_ORM_TYPE
+    _str: str | None = None
 
     def __init__(
         self,
@@ -564,26 +575,26 @@ class Column(
         :param meta_data: Métadonnées de la colonne.
         :param table: Table à laquelle appartient la colonne.
         """
-        self._name = meta_data.name
-        self.type = meta_data.type
-        self.length = meta_data.length
-        self.nullable = meta_data.nullable
-        self.primary_key = meta_data.primary_key
-        self.default = meta_data.default
-        self.unique = meta_data.unique
+        self._name = intern(str(meta_data.name))
+        (
+            self.type,
+            self.length,
+            self.nullable,
+            self.primary_key,
+            self.default,
+            self.unique,
+        ) = _COLUMN_META_FIELDS(meta_data)
         self.table = table
-        self._link_column = cast(
-            Type[COLUMN_ORM_TYPE | FOREIGNKEY_COLUMN_ORM_TYPE],
-            next(
-                column
-                for column in table._link_table.columns
-                if column.meta.name == self._name
-            ),
-        )
+        self._link_column = table._link_table.columns[self._name]
 
     def __str__(self) -> str:
-        """Retourne une représentation de la colonne."""
-        return f"Colonne {self.name} de type {self.type.value} de la table {self.table.vb_name}"
+        """Retourne une représentation de la colonne (calculée une seule fois)."""
+        if self._str is None:
+            self._str = (
+                f"Colonne {self.name} de type {self.type}"
+                f" de la table {self.table.vb_name}"
+            )
+        return self._str
 
     @property
     def name(self) -> str:
@@ -601,12 +612,10 @@ class Column(
 
         :param column_name: Nom de la colonne.
         """
-        self._link_column = cast(
-            Type[COLUMN_ORM_TYPE | FOREIGNKEY_COLUMN_ORM_TYPE],
-            self._link_column.set_name(column_name),  # type: ignore
-        )
-        self._name = column_name
-        self.table.refresh()
+        self._link_column = self._link_column.set_name(column_name)
+        self._name = intern(column_name)
+        self._str = None
+        self.table._reload()
 
 
 class ForeignKeyColumn(
@@ -659,11 +668,17 @@ class ForeignKeyColumn(
         self.on_update = meta_data.on_update
 
     def __str__(self) -> str:
-        """Retourne une représentation de la colonne de clé étrangère."""
-        return (
-            f"Colonne {self.name} de type {self.type.value} de la table"
-            f" {self.table.vb_name} avec clé étrangère vers la table {self.foreign_table.vb_name}"
-        )
+        """
+        Retourne une représentation de la colonne de clé étrangère (calculée une
+        seule fois).
+        """
+        if self._str is None:
+            self._str = (
+                f"Colonne {self.name} de type {self.type} de la table"
+                f" {self.table.vb_name} avec clé étrangère vers la table"
+                f" {self.foreign_table.vb_name}"
+            )
+        return self._str
 
 
 class UniqueConstraint:
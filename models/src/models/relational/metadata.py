@@ -2,100 +2,191 @@
 Méta-données d'un schéma de base de données.
 
 - Classes:
-    - ColumnMetaDict: Dictionnaire des métadonnées d'une colonne.
     - ColumnMeta: Métadonnées d'une colonne.
-    - ForeignKeyColumnMetaDict: Dictionnaire des métadonnées d'une colonne de clé étrangère.
     - ForeignKeyColumnMeta: Métadonnées d'une colonne de clé étrangère.
-    - ColumnType: Types de colonnes.
-    - DefaultDate: Types de dates par défaut.
-    - ForeignKeyAction: Actions de clé étrangère.
     - UniqueColumnsMeta: Métadonnées des colonnes uniques.
-    - TableMetaDict: Dictionnaire des métadonnées d'une table.
-    - DatabaseMetaDict: Dictionnaire des métadonnées d'une base de données.
+
+Les types sans dépendance à pydantic (`ColumnType`, `DefaultDate`,
+`ForeignKeyAction` et les dictionnaires typés) sont définis dans
+`metadata_types` et ré-exportés ici.
 """
 
 from __future__ import annotations
 
-from enum import Enum
-from pydantic import BaseModel, field_validator, ValidationInfo
-from typing import Any, TypedDict
-from re import match
+from pydantic import BaseModel, ConfigDict, field_validator, ValidationInfo
+from typing import Any, Callable, Self
+import re
+from sys import intern
 from datetime import datetime, date
 
-
-class ColumnType(str, Enum):
+from models.relational.metadata_types import (
+    ColumnType,
+    DefaultDate,
+    ForeignKeyAction,
+    ColumnMetaDict,
+    ForeignKeyColumnMetaDict,
+    TableMetaDict,
+    DatabaseMetaDict,
+)
+
+__all__ = [
+    "ColumnType",
+    "DefaultDate",
+    "ForeignKeyAction",
+    "ColumnMetaDict",
+    "ColumnMeta",
+    "ForeignKeyColumnMetaDict",
+    "ForeignKeyColumnMeta",
+    "UniqueColumnsMeta",
+    "TableMetaDict",
+    "DatabaseMetaDict",
+]
+
+
+# Formats acceptés pour les valeurs par défaut des champs DATE et DATETIME :
+# AAAA-MM-JJ ou JJ-MM-AAAA, avec "-" ou "/" comme séparateur.
+_DATE_PATTERN = (
+    r"(?:(?P<y1>\d{4})(?P<s1>[-/])(?P<m1>\d{2})(?P=s1)(?P<d1>\d{2})"
+    r"|(?P<d2>\d{2})(?P<s2>[-/])(?P<m2>\d{2})(?P=s2)(?P<y2>\d{4}))"
+)
+_DATE_ANY = re.compile(_DATE_PATTERN)
+_DT_ANY = re.compile(
+    _DATE_PATTERN + r" (?P<hour>\d{2}):(?P<minute>\d{2}):(?P<second>\d{2})"
+)
+
+
+def _is_iso_date(value: str) -> bool:
     """
-    Types de colonnes.
+    Indique si une chaîne a la forme AAAA-MM-JJ, seule forme de date que
+    `fromisoformat` doit traiter ici (il accepte aussi d'autres formes ISO).
+
+    :param value: Chaîne à tester.
+    :return: Vrai si la chaîne a la forme AAAA-MM-JJ.
     """
 
-    INT = "INT"
-    VARCHAR = "VARCHAR"
-    TEXT = "TEXT"
-    DATE = "DATE"
-    DATETIME = "DATETIME"
-    BOOLEAN = "BOOLEAN"
-    DECIMAL = "DECIMAL"
+    return len(value) == 10 and value[4] == "-" and value[7] == "-"
 
 
-class DefaultDate(str, Enum):
+def _is_iso_datetime(value: str) -> bool:
     """
-    Types de colonnes.
+    Indique si une chaîne a la forme AAAA-MM-JJ HH:MM:SS.
+
+    :param value: Chaîne à tester.
+    :return: Vrai si la chaîne a la forme AAAA-MM-JJ HH:MM:SS.
     """
 
-    CURRENT_DATE = "today"
-    CURRENT_TIMESTAMP = "now"
+    return (
+        len(value) == 19
+        and _is_iso_date(value[:10])
+        and value[10] == " "
+        and value[13] == ":"
+        and value[16] == ":"
+    )
 
 
-class ForeignKeyAction(str, Enum):
+def _date_fields(found: re.Match[str]) -> tuple[int, int, int]:
     """
-    Actions de clé étrangère.
+    Extrait l'année, le mois et le jour d'une date reconnue par `_DATE_ANY`
+    ou `_DT_ANY`.
+
+    :param found: Correspondance de l'expression régulière.
+    :return: Année, mois et jour.
     """
 
-    CASCADE = "CASCADE"
-    SET_NULL = "SET NULL"
-    RESTRICT = "RESTRICT"
-    NO_ACTION = "NO ACTION"
-    SET_DEFAULT = "SET DEFAULT"
+    if found["y1"] is not None:
+        return int(found["y1"]), int(found["m1"]), int(found["d1"])
+    return int(found["y2"]), int(found["m2"]), int(found["d2"])
 
-    @staticmethod
-    def create(action: str) -> ForeignKeyAction:
-        """
-        Crée une action de clé étrangère.
 
-        :param action: Action de clé étrangère.
-        :return: Action de clé étrangère.
-        """
+# Type Python attendu pour la valeur par défaut des types sans conversion.
+_EXPECTED_PY_TYPE: dict[ColumnType, type] = {
+    ColumnType.BOOLEAN: bool,
+    ColumnType.INT: int,
+    ColumnType.DECIMAL: float,
+    ColumnType.VARCHAR: str,
+    ColumnType.TEXT: str,
+}
+_DEFAULT_TYPE_ERRORS: dict[ColumnType, str] = {
+    ColumnType.BOOLEAN: "La valeur par défaut doit être un booléen pour un champ BOOLEAN.",
+    ColumnType.INT: "La valeur par défaut doit être un entier pour un champ INT.",
+    ColumnType.DECIMAL: "La valeur par défaut doit être un flottant pour un champ DECIMAL.",
+    ColumnType.VARCHAR: "La valeur par défaut doit être une chaîne de caractères pour un champ VARCHAR.",
+    ColumnType.TEXT: "La valeur par défaut doit être une chaîne de caractères pour un champ TEXT.",
+}
+
+
+# Longueur maximale des types de colonnes qui acceptent une longueur.
+_LENGTH_LIMITS: dict[ColumnType, int] = {
+    ColumnType.VARCHAR: 255,
+    ColumnType.TEXT: 65535,
+}
 
-        return {
-            "": ForeignKeyAction.NO_ACTION,
-            "CASCADE": ForeignKeyAction.CASCADE,
-            "SET NULL": ForeignKeyAction.SET_NULL,
-            "RESTRICT": ForeignKeyAction.RESTRICT,
-            "NO ACTION": ForeignKeyAction.NO_ACTION,
-            "SET DEFAULT": ForeignKeyAction.SET_DEFAULT,
-        }[action]
 
+# Valeurs par défaut désignant la date (et l'heure) courante.
+_CURRENT_DATE = intern(DefaultDate.CURRENT_DATE.value)
+_CURRENT_TIMESTAMP = intern(DefaultDate.CURRENT_TIMESTAMP.value)
+# Valeurs par défaut conservées telles quelles à la lecture du schéma.
+_REFLECTED_SENTINELS = (None, _CURRENT_DATE, _CURRENT_TIMESTAMP)
 
-class ColumnMetaDict(TypedDict):
+
+def _check_date_default(value: Any) -> Any:
     """
-    Dictionnaire des métadonnées d'une colonne.
+    Vérifie et convertit la valeur par défaut d'un champ DATE.
 
-    :param name: Nom de la colonne.
-    :param type: Type de colonne.
-    :param length: Longueur de la colonne.
-    :param nullable: Colonne nullable.
-    :param primary_key: Colonne clé primaire.
-    :param unique: Colonne unique.
-    :param default: Valeur par défaut de la colonne.
+    :param value: Valeur par défaut.
+    :return: Date.
     """
 
-    name: str
-    type: str
-    length: int | None
-    nullable: bool
-    primary_key: bool
-    unique: bool
-    default: Any | None
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        if value == _CURRENT_DATE:
+            return date.today()
+        if _is_iso_date(value):
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                pass
+        found = _DATE_ANY.fullmatch(value)
+        if found:
+            return date(*_date_fields(found))
+    raise ValueError("Cette valeur n'est pas supportée pour un champ DATE.")
+
+
+def _check_datetime_default(value: Any) -> Any:
+    """
+    Vérifie et convertit la valeur par défaut d'un champ DATETIME.
+
+    :param value: Valeur par défaut.
+    :return: Date et heure.
+    """
+
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        if value == _CURRENT_TIMESTAMP:
+            return datetime.now()
+        if _is_iso_datetime(value):
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                pass
+        found = _DT_ANY.fullmatch(value)
+        if found:
+            return datetime(
+                *_date_fields(found),
+                int(found["hour"]),
+                int(found["minute"]),
+                int(found["second"]),
+            )
+    raise ValueError("Cette valeur n'est pas supportée pour un champ DATETIME.")
+
+
+# Conversion de la valeur par défaut des types DATE et DATETIME.
+_DEFAULT_VALIDATORS: dict[ColumnType, Callable[[Any], Any]] = {
+    ColumnType.DATE: _check_date_default,
+    ColumnType.DATETIME: _check_datetime_default,
+}
 
 
 class ColumnMeta(BaseModel):
@@ -111,6 +202,13 @@ class ColumnMeta(BaseModel):
     :param default: Valeur par défaut de la colonne.
     """
 
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=False,
+        arbitrary_types_allowed=False,
+    )
+
     name: str
     type: ColumnType
     length: int | None
@@ -119,6 +217,46 @@ class ColumnMeta(BaseModel):
     unique: bool
     default: Any | None = None
 
+    @classmethod
+    def from_trusted(cls, **data: Any) -> Self:
+        """
+        Construit les métadonnées sans validation, à partir de données sûres
+        (introspection de la base de données, retour de `get_dict`).
+
+        Les valeurs par défaut des champs DATE et DATETIME, lues sous forme de
+        chaîne (sans les apostrophes du littéral SQL, retirées par la couche
+        ORM), sont converties si leur format est reconnu. `CURRENT_DATE` et
+        `CURRENT_TIMESTAMP` sont conservées telles quelles, pour ne pas figer
+        la date de la lecture, et une valeur non reconnue est conservée sans
+        lever d'erreur.
+
+        :param data: Valeurs des champs.
+        :return: Métadonnées.
+        """
+
+        data["name"] = intern(data["name"])
+        default = data.get("default")
+        validator = _DEFAULT_VALIDATORS.get(data["type"])
+        if validator is not None and default not in _REFLECTED_SENTINELS:
+            try:
+                default = validator(default)
+            except ValueError:
+                pass
+            data["default"] = default
+        return cls.model_construct(**data)
+
+    @field_validator("name")
+    def check_name(cls, value: str) -> str:
+        """
+        Interne le nom de la colonne : les noms répétés d'une table à l'autre
+        (`id`, `name`...) partagent un seul objet.
+
+        :param value: Nom de la colonne.
+        :return: Nom de la colonne.
+        """
+
+        return intern(value)
+
     @field_validator("length")
     def check_length(cls, value: int | None, info: ValidationInfo) -> int | None:
         """
@@ -129,10 +267,9 @@ class ColumnMeta(BaseModel):
         """
 
         if value is not None:
-            if (
-                info.data["type"] != ColumnType.VARCHAR
-                and info.data["type"] != ColumnType.TEXT
-            ):
+            column_type = info.data["type"]
+            limit = _LENGTH_LIMITS.get(column_type)
+            if limit is None:
                 raise ValueError(
                     "La longueur n'est pas supportée pour ce type de colonne."
                 )
@@ -140,14 +277,9 @@ class ColumnMeta(BaseModel):
             if value <= 0:
                 raise ValueError("La longueur doit être positive.")
 
-            if info.data["type"] == ColumnType.TEXT and value > 65535:
+            if value > limit:
                 raise ValueError(
-                    "La longueur maximale pour un champ TEXT est de 65535."
-                )
-
-            if info.data["type"] == ColumnType.VARCHAR and value > 255:
-                raise ValueError(
-                    "La longueur maximale pour un champ VARCHAR est de 255."
+                    f"La longueur maximale pour un champ {column_type} est de {limit}."
                 )
 
         return value
@@ -162,94 +294,16 @@ class ColumnMeta(BaseModel):
         :return: Valeur par défaut de la colonne.
         """
 
-        if value is not None:
-            if info.data["type"] == ColumnType.BOOLEAN and not isinstance(value, bool):
-                raise ValueError(
-                    "La valeur par défaut doit être un booléen pour un champ BOOLEAN."
-                )
-
-            if info.data["type"] == ColumnType.INT and not isinstance(value, int):
-                raise ValueError(
-                    "La valeur par défaut doit être un entier pour un champ INT."
-                )
-
-            if info.data["type"] == ColumnType.DECIMAL and not isinstance(value, float):
-                raise ValueError(
-                    "La valeur par défaut doit être un flottant pour un champ DECIMAL."
-                )
-
-            if info.data["type"] == ColumnType.VARCHAR and not isinstance(value, str):
-                raise ValueError(
-                    "La valeur par défaut doit être une chaîne de caractères pour un champ VARCHAR."
-                )
-
-            if info.data["type"] == ColumnType.TEXT and not isinstance(value, str):
-                raise ValueError(
-                    "La valeur par défaut doit être une chaîne de caractères pour un champ TEXT."
-                )
-
-            if info.data["type"] == ColumnType.DATE:
-                if isinstance(value, date):
-                    return value
-                elif isinstance(value, str):
-                    if match(r"^\d{2}/\d{2}/\d{4}$", value):
-                        return date.fromisoformat(
-                            f"{value[6:]}-{value[3:5]}-{value[:2]}"
-                        )
-                    elif match(r"^\d{2}-\d{2}-\d{4}$", value):
-                        return date.fromisoformat(
-                            f"{value[6:]}-{value[3:5]}-{value[:2]}"
-                        )
-                    elif match(r"^\d{4}/\d{2}/\d{2}$", value):
-                        return date.fromisoformat(
-                            f"{value[:4]}-{value[5:7]}-{value[8:]}"
-                        )
-                    elif match(r"^\d{4}-\d{2}-\d{2}$", value):
-                        return date.fromisoformat(value)
-                    elif value == DefaultDate.CURRENT_DATE.value:
-                        return date.today()
-                    else:
-                        raise ValueError(
-                            "Cette valeur n'est pas supportée pour un champ DATE."
-                        )
-                else:
-                    raise ValueError(
-                        "Cette valeur n'est pas supportée pour un champ DATE."
-                    )
-
-            if info.data["type"] == ColumnType.DATETIME:
-                if isinstance(value, datetime):
-                    return value
-                elif isinstance(value, str):
-                    if match(r"^\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}$", value):
-                        return datetime.strptime(
-                            f"{value[6:]}-{value[3:5]}-{value[:2]} {value[11:]}",
-                            "%Y-%m-%d %H:%M:%S",
-                        )
-                    elif match(r"^\d{2}-\d{2}-\d{4} \d{2}:\d{2}:\d{2}$", value):
-                        return datetime.strptime(
-                            f"{value[6:]}-{value[3:5]}-{value[:2]} {value[11:]}",
-                            "%Y-%m-%d %H:%M:%S",
-                        )
-                    elif match(r"^\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2}$", value):
-                        return datetime.strptime(
-                            f"{value[:4]}-{value[5:7]}-{value[8:]} {value[11:]}",
-                            "%Y-%m-%d %H:%M:%S",
-                        )
-                    elif match(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$", value):
-                        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
-                    elif value == DefaultDate.CURRENT_TIMESTAMP.value:
-                        return datetime.now()
-                    else:
-                        raise ValueError(
-                            "Cette valeur n'est pas supportée pour un champ DATETIME."
-                        )
-                else:
-                    raise ValueError(
-                        "Cette valeur n'est pas supportée pour un champ DATETIME."
-                    )
-
-        return value
+        if value is None:
+            return value
+        column_type = info.data["type"]
+        expected = _EXPECTED_PY_TYPE.get(column_type)
+        if expected is not None:
+            if not isinstance(value, expected):
+                raise ValueError(_DEFAULT_TYPE_ERRORS[column_type])
+            return value
+        validator = _DEFAULT_VALIDATORS.get(column_type)
+        return validator(value) if validator is not None else value
 
     def get_dict(self) -> ColumnMetaDict:
         """
@@ -258,38 +312,7 @@ class ColumnMeta(BaseModel):
         :return: Métadonnées de la colonne sous forme de dictionnaire.
         """
 
-        return {
-            "name": self.name,
-            "type": self.type.value,
-            "length": self.length,
-            "nullable": self.nullable,
-            "primary_key": self.primary_key,
-            "unique": self.unique,
-            "default": self.default,
-        }
-
-
-class ForeignKeyColumnMetaDict(ColumnMetaDict):
-    """
-    Dictionnaire des métadonnées d'une colonne de clé étrangère.
-
-    :param name: Nom de la colonne.
-    :param type: Type de colonne.
-    :param length: Longueur de la colonne.
-    :param nullable: Colonne nullable.
-    :param primary_key: Colonne clé primaire.
-    :param unique: Colonne unique.
-    :param default: Valeur par défaut de la colonne.
-    :param foreign_table_name: Nom de la table étrangère.
-    :param foreign_column_name: Nom de la colonne étrangère.
-    :param on_delete: Action en cas de suppression.
-    :param on_update: Action en cas de mise à jour.
-    """
-
-    foreign_table: str
-    foreign_column: str
-    on_delete: str
-    on_update: str
+        return self.__dict__.copy()  # type: ignore[return-value]
 
 
 class ForeignKeyColumnMeta(ColumnMeta):
@@ -321,19 +344,10 @@ class ForeignKeyColumnMeta(ColumnMeta):
         :return: Métadonnées de la colonne sous forme de dictionnaire.
         """
 
-        return {
-            "name": self.name,
-            "type": self.type.value,
-            "length": self.length,
-            "nullable": self.nullable,
-            "primary_key": self.primary_key,
-            "unique": self.unique,
-            "default": self.default,
-            "foreign_table": self.foreign_table_name,
-            "foreign_column": self.foreign_column_name,
-            "on_delete": self.on_delete.value,
-            "on_update": self.on_update.value,
-        }
+        data = self.__dict__.copy()
+        data["foreign_table"] = data.pop("foreign_table_name")
+        data["foreign_column"] = data.pop("foreign_column_name")
+        return data  # type: ignore[return-value]
 
 
 class UniqueColumnsMeta(BaseModel):
@@ -344,33 +358,12 @@ class UniqueColumnsMeta(BaseModel):
     :param columns: Colonnes uniques.
     """
 
-    name: str
-    columns: set[str]
-
-
-class TableMetaDict(TypedDict):
-    """
-    Dictionnaire des métadonnées d'une table.
-
-    :param name: Nom de la table.
-    :param columns: Colonnes de la table.
-    :param unique_columns: Colonnes uniques de la table.
-    """
-
-    name: str
-    columns: dict[str, ColumnMetaDict | ForeignKeyColumnMetaDict]
-    unique_columns: dict[str, set[str]]
-
-
-class DatabaseMetaDict(TypedDict):
-    """
-    Dictionnaire des métadonnées d'une base de données.
-
-    :param name: Nom de la base de données.
-    :param type: Type de la base de données.
-    :param tables: Tables de la base de données.
-    """
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=False,
+        arbitrary_types_allowed=False,
+    )
 
     name: str
-    type: str
-    tables: dict[str, TableMetaDict]
+    columns: frozenset[str]
@@ -0,0 +1,144 @@
+"""
+Types des méta-données d'un schéma de base de données, sans dépendance à
+pydantic.
+
+- Classes:
+    - ColumnType: Types de colonnes.
+    - DefaultDate: Types de dates par défaut.
+    - ForeignKeyAction: Actions de clé étrangère.
+    - ColumnMetaDict: Dictionnaire des métadonnées d'une colonne.
+    - ForeignKeyColumnMetaDict: Dictionnaire des métadonnées d'une colonne de clé étrangère.
+    - TableMetaDict: Dictionnaire des métadonnées d'une table.
+    - DatabaseMetaDict: Dictionnaire des métadonnées d'une base de données.
+"""
+
+from __future__ import annotations
+
+from enum import StrEnum
+from typing import Any, TypedDict
+
+
+class ColumnType(StrEnum):
+    """
+    Types de colonnes.
+    """
+
+    INT = "INT"
+    VARCHAR = "VARCHAR"
+    TEXT = "TEXT"
+    DATE = "DATE"
+    DATETIME = "DATETIME"
+    BOOLEAN = "BOOLEAN"
+    DECIMAL = "DECIMAL"
+
+
+class DefaultDate(StrEnum):
+    """
+    Types de colonnes.
+    """
+
+    CURRENT_DATE = "today"
+    CURRENT_TIMESTAMP = "now"
+
+
+class ForeignKeyAction(StrEnum):
+    """
+    Actions de clé étrangère.
+    """
+
+    CASCADE = "CASCADE"
+    SET_NULL = "SET NULL"
+    RESTRICT = "RESTRICT"
+    NO_ACTION = "NO ACTION"
+    SET_DEFAULT = "SET DEFAULT"
+
+    @staticmethod
+    def create(action: str) -> ForeignKeyAction:
+        """
+        Crée une action de clé étrangère.
+
+        :param action: Action de clé étrangère.
+        :return: Action de clé étrangère.
+        """
+
+        return _FK_ACTION_MAP[action]
+
+
+# Actions de clé étrangère indexées par leur nom SQL ("" : aucune action).
+_FK_ACTION_MAP: dict[str, ForeignKeyAction] = {
+    "": ForeignKeyAction.NO_ACTION,
+    **{action.value: action for action in ForeignKeyAction},
+}
+
+
+class ColumnMetaDict(TypedDict):
+    """
+    Dictionnaire des métadonnées d'une colonne.
+
+    :param name: Nom de la colonne.
+    :param type: Type de colonne.
+    :param length: Longueur de la colonne.
+    :param nullable: Colonne nullable.
+    :param primary_key: Colonne clé primaire.
+    :param unique: Colonne unique.
+    :param default: Valeur par défaut de la colonne.
+    """
+
+    name: str
+    type: ColumnType
+    length: int | None
+    nullable: bool
+    primary_key: bool
+    unique: bool
+    default: Any | None
+
+
+class ForeignKeyColumnMetaDict(ColumnMetaDict):
+    """
+    Dictionnaire des métadonnées d'une colonne de clé étrangère.
+
+    :param name: Nom de la colonne.
+    :param type: Type de colonne.
+    :param length: Longueur de la colonne.
+    :param nullable: Colonne nullable.
+    :param primary_key: Colonne clé primaire.
+    :param unique: Colonne unique.
+    :param default: Valeur par défaut de la colonne.
+    :param foreign_table_name: Nom de la table étrangère.
+    :param foreign_column_name: Nom de la colonne étrangère.
+    :param on_delete: Action en cas de suppression.
+    :param on_update: Action en cas de mise à jour.
+    """
+
+    foreign_table: str
+    foreign_column: str
+    on_delete: ForeignKeyAction
+    on_update: ForeignKeyAction
+
+
+class TableMetaDict(TypedDict):
+    """
+    Dictionnaire des métadonnées d'une table.
+
+    :param name: Nom de la table.
+    :param columns: Colonnes de la table.
+    :param unique_columns: Colonnes uniques de la table.
+    """
+
+    name: str
+    columns: dict[str, ColumnMetaDict | ForeignKeyColumnMetaDict]
+    unique_columns: dict[str, frozenset[str]]
+
+
+class DatabaseMetaDict(TypedDict):
+    """
+    Dictionnaire des métadonnées d'une base de données.
+
+    :param name: Nom de la base de données.
+    :param type: Type de la base de données.
+    :param tables: Tables de la base de données.
+    """
+
+    name: str
+    type: str
+    tables: dict[str, TableMetaDict]
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from datetime import date
+from functools import lru_cache
+from sys import intern
 from typing import Any, Type
-from enum import Enum
 
+from models.relational.orm import _sql
 from models.relational.metadata import (
     ColumnMeta,
     ForeignKeyColumnMeta,
@@ -22,40 +26,13 @@ class ORM(ABC):
     """
 
     schema: str | None
+    _prereflected: dict[str, ORM.Table]
+    # Gabarit du nom d'une table dans une requête SQL, fixé une fois pour toutes
+    # à partir du schéma (ex. `"main.{}"` ou `"{}"`).
+    _table_name_template: str
 
-    class SQL_Verbs(str, Enum):
-        """
-        Verbes SQL.
-        """
-
-        SELECT = "SELECT"
-        INSERT = "INSERT"
-        UPDATE = "UPDATE"
-        DELETE = "DELETE"
-        CREATE = "CREATE"
-        DROP = "DROP"
-        ALTER = "ALTER"
-        ADD = "ADD"
-        TO = "TO"
-        FOREIGNKEY = "FOREIGN KEY"
-        REFERENCES = "REFERENCES"
-        PRIMARYKEY = "PRIMARY KEY"
-        UNIQUE = "UNIQUE"
-        CONSTRAINT = "CONSTRAINT"
-        NOT_NULL = "NOT NULL"
-        DEFAULT = "DEFAULT"
-        FROM = "FROM"
-        WHERE = "WHERE"
-        ALTER_TABLE = "ALTER TABLE"
-        TABLE = "TABLE"
-        ALTER_COLUMN = "ALTER COLUMN"
-        ADD_COLUMN = "ADD COLUMN"
-        DROP_COLUMN = "DROP COLUMN"
-        RENAME_COLUMN = "RENAME COLUMN"
-        ON_DELETE = "ON DELETE"
-        CASCADE = "CASCADE"
-        ON_UPDATE = "ON UPDATE"
-        RENAME_TO = "RENAME TO"
+    # Espace de noms des fragments SQL (ex. `ORM.SQL_Verbs.NOT_NULL`).
+    SQL_Verbs = _sql
 
     class Table(ABC):
         """
@@ -64,14 +41,24 @@ class ORM(ABC):
         - Attributs:
             - name: Nom de la table.
             - link_table: Table de l'ORM.
-            - columns_meta: Métadonnées des colonnes.
+            - columns: Colonnes, indexées par leur nom.
             - unique_constraints: Contraintes d'unicité.
             - orm: ORM.
         """
 
+        __slots__ = (
+            "_name",
+            "_link_table",
+            "columns",
+            "unique_constraints",
+            "orm",
+            "_quoted_name",
+        )
+
         _name: str
         _link_table: Any
-        columns: list[ORM.Column | ORM.ForeignKeyColumn]
+        _quoted_name: str
+        columns: dict[str, ORM.Column | ORM.ForeignKeyColumn]
         unique_constraints: list[UniqueColumnsMeta]
         orm: ORM
 
@@ -90,8 +77,6 @@ class ORM(ABC):
             :param **kwargs: Arguments nommés.
             """
 
-            pass
-
         @abstractmethod
         def add_column(
             self,
@@ -103,8 +88,6 @@ class ORM(ABC):
             :return: Colonne.
             """
 
-            pass
-
         @abstractmethod
         def get_column(self, name: str) -> ORM.Column | ORM.ForeignKeyColumn:
             """
@@ -113,8 +96,6 @@ class ORM(ABC):
             :return: Colonne.
             """
 
-            pass
-
         @property
         @abstractmethod
         def name(self) -> str:
@@ -123,8 +104,6 @@ class ORM(ABC):
             :return: Nom de la table.
             """
 
-            pass
-
         @name.setter
         @abstractmethod
         def name(self, name: str) -> None:
@@ -133,16 +112,26 @@ class ORM(ABC):
             :param name: Nom de la table.
             """
 
-            pass
-
         def _table_name_for_request(self, name: str | None = None) -> str:
             """
             Retourne le nom de la table pour une requête SQL.
             :param name: Nom de la table.
             :return: Nom de la table pour une requête SQL.
             """
-            name = name or self.name
-            return f'{self.orm.schema}."{name}"' if self.orm.schema else name
+            if name is None:
+                return self._quoted_name
+            return self._quote_table_name(name)
+
+        def _quote_table_name(self, name: str) -> str:
+            """
+            Met le nom d'une table entre guillemets et le préfixe par le schéma
+            de la couche ORM, lui aussi entre guillemets.
+            :param name: Nom de la table.
+            :return: Nom de la table pour une requête SQL.
+            """
+            return self.orm._table_name_template.format(
+                ORM.Column._name_for_request(name)
+            )
 
     class Column(ABC):
         """
@@ -152,11 +141,15 @@ class ORM(ABC):
             - meta: Métadonnées de la colonne.
             - link_column: Colonne de l'ORM.
             - orm: ORM.
+            - _quoted_name: Nom de la colonne pour une requête SQL.
         """
 
+        __slots__ = ("meta", "_link_column", "orm", "table", "_quoted_name")
+
         meta: ColumnMeta
         _link_column: Any
         orm: ORM
+        _quoted_name: str
 
         @abstractmethod
         def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -166,8 +159,6 @@ class ORM(ABC):
             :param **kwargs: Arguments nommés.
             """
 
-            pass
-
         @abstractmethod
         def set_name(self, name: str) -> ORM.Column | ORM.ForeignKeyColumn:
             """
@@ -176,16 +167,16 @@ class ORM(ABC):
             :return: Colonne.
             """
 
-            pass
-
         @staticmethod
+        @lru_cache(maxsize=4096)
         def _name_for_request(name: str) -> str:
             """
-            Retourne le nom de la colonne pour une requête SQL.
+            Retourne le nom de la colonne pour une requête SQL. Les guillemets
+            contenus dans le nom sont doublés.
             :param name: Nom de la colonne.
             :return: Nom de la colonne pour une requête SQL.
             """
-            return f'"{name}"'
+            return intern(f'"{name.translate(_QUOTE_ESCAPES)}"')
 
         @staticmethod
         def _nullable_for_request(nullable: bool) -> str:
@@ -194,22 +185,23 @@ class ORM(ABC):
             :param nullable: Nullabilité de la colonne.
             :return: Contrainte de nullabilité pour une requête SQL.
             """
-            return ORM.SQL_Verbs.NOT_NULL.value if not nullable else ""
+            return _NOT_NULL_SQL_BY_NULLABLE[nullable]
 
         @staticmethod
-        def _default_for_request(default: Any) -> str:
+        def _default_for_request(default: Any) -> str | None:
             """
             Retourne la valeur par défaut pour une requête SQL.
-            :return: Valeur par défaut pour une requête SQL.
+            Les textes et les dates sont écrits en littéraux SQL, apostrophes
+            doublées.
+            :param default: Valeur par défaut de la colonne.
+            :return: Valeur par défaut pour une requête SQL, None si la colonne
+                n'en a pas.
             """
-            default_rq = ""
-            if default is not None:
-                default_rq = f"{ORM.SQL_Verbs.DEFAULT.value} "
-                if isinstance(default, str):
-                    default_rq += f"'{default}'"
-                else:
-                    default_rq += default
-            return default_rq
+            if default is None:
+                return None
+            if isinstance(default, (str, date)):
+                return f"{_sql.DEFAULT} '" + str(default).replace("'", "''") + "'"
+            return f"{_sql.DEFAULT} {default}"
 
         @staticmethod
         def _primary_key_for_request(primary_key: bool) -> str:
@@ -218,7 +210,7 @@ class ORM(ABC):
             :param primary_key: Clé primaire de la colonne.
             :return: Contrainte de clé primaire pour une requête SQL.
             """
-            return ORM.SQL_Verbs.PRIMARYKEY.value if primary_key else ""
+            return _PRIMARY_KEY_SQL_BY_FLAG[primary_key]
 
         @staticmethod
         def _unique_for_request(unique: bool) -> str:
@@ -227,27 +219,79 @@ class ORM(ABC):
             :param unique: Unicité de la colonne.
             :return: Contrainte d'unicité pour une requête SQL.
             """
-            return ORM.SQL_Verbs.UNIQUE.value if unique else ""
+            return _UNIQUE_SQL_BY_FLAG[unique]
+
+        @staticmethod
+        @lru_cache(maxsize=None)
+        def _definition_template(
+            nullable: bool, primary_key: bool, unique: bool
+        ) -> str:
+            """
+            Retourne le gabarit de la définition SQL d'une colonne pour une
+            combinaison de contraintes. Les fragments constants non vides y sont
+            déjà insérés ; restent à remplir `name`, `type`, puis `default` et
+            `foreign_key`, précédés d'une espace lorsqu'ils ne sont pas vides.
+            :param nullable: Nullabilité de la colonne.
+            :param primary_key: Clé primaire de la colonne.
+            :param unique: Unicité de la colonne.
+            :return: Gabarit de la définition SQL de la colonne.
+            """
+            return "".join(
+                (
+                    "{name} {type}",
+                    _spaced(ORM.Column._nullable_for_request(nullable)),
+                    "{default}",
+                    _spaced(ORM.Column._primary_key_for_request(primary_key)),
+                    _spaced(ORM.Column._unique_for_request(unique)),
+                    "{foreign_key}",
+                )
+            )
+
+        @staticmethod
+        def _definition_for_request(
+            column: ColumnMeta | ForeignKeyColumnMeta,
+            column_type: str,
+            foreign_table_name: str,
+        ) -> str:
+            """
+            Retourne la définition d'une colonne pour une requête SQL.
+            :param column: Colonne.
+            :param column_type: Type SQL compilé de la colonne.
+            :param foreign_table_name: Nom de la table étrangère pour une
+                requête SQL.
+            :return: Définition de la colonne pour une requête SQL.
+            """
+            return ORM.Column._definition_template(
+                column.nullable, column.primary_key, column.unique
+            ).format(
+                name=ORM.Column._name_for_request(column.name),
+                type=column_type,
+                default=_spaced(ORM.Column._default_for_request(column.default)),
+                foreign_key=_spaced(
+                    ORM.Column._foreign_key_for_request(column, foreign_table_name)
+                ),
+            )
 
         @staticmethod
         def _foreign_key_for_request(
             column: ColumnMeta | ForeignKeyColumnMeta, foreign_table_name: str
-        ) -> str:
+        ) -> str | None:
             """
             Retourne la contrainte de clé étrangère pour une requête SQL.
             :param column: Colonne.
-            :return: Contrainte de clé étrangère pour une requête SQL.
-            """
-            foreign_key = ""
-            if isinstance(column, ForeignKeyColumnMeta):
-                foreign_key = (
-                    f'FOREIGN KEY ("{column.name}") REFERENCES '
-                    f"{foreign_table_name}"
-                    f' ("{column.foreign_column_name}")'
-                    f" ON DELETE {column.on_delete.value}"
-                    f" ON UPDATE {column.on_update.value}"
-                )
-            return foreign_key
+            :return: Contrainte de clé étrangère pour une requête SQL, None si
+                la colonne n'est pas une clé étrangère.
+            """
+            if type(column) is not ForeignKeyColumnMeta:
+                return None
+            name_for_request = ORM.Column._name_for_request
+            return _FOREIGN_KEY_SQL % (
+                name_for_request(column.name),
+                foreign_table_name,
+                name_for_request(column.foreign_column_name),
+                column.on_delete,
+                column.on_update,
+            )
 
     class ForeignKeyColumn(Column):
         """
@@ -259,6 +303,8 @@ class ORM(ABC):
             - orm: ORM.
         """
 
+        __slots__ = ()
+
         meta: ForeignKeyColumnMeta
 
     class UniqueConstraint(ABC):
@@ -271,8 +317,10 @@ class ORM(ABC):
             - link_constraint: Contrainte de l'ORM.
         """
 
+        __slots__ = ("name", "columns", "_link_constraint")
+
         name: str
-        columns: set[str]
+        columns: frozenset[str]
         _link_constraint: Any
 
     class NoSuchTableError(Exception):
@@ -321,8 +369,6 @@ class ORM(ABC):
         :param **kwargs: Arguments nommés.
         """
 
-        pass
-
     @abstractmethod
     def create_table(
         self,
@@ -338,16 +384,29 @@ class ORM(ABC):
         :return: Table.
         """
 
-        pass
-
     @abstractmethod
-    def get_tables(self) -> dict[str, Table]:
+    def get_tables(self) -> Mapping[str, Table]:
         """
         Récupère les tables de la base de données.
         :return: Tables.
         """
 
-        pass
+    @abstractmethod
+    def reflect_many(self, table_names: list[str]) -> dict[str, Table]:
+        """
+        Récupère plusieurs tables de la base de données en une seule réflexion.
+        Les tables récupérées sont conservées dans `_prereflected`.
+        :param table_names: Noms des tables.
+        :return: Tables.
+        """
+
+    @abstractmethod
+    def has_table(self, table_name: str) -> bool:
+        """
+        Vérifie si une table existe dans la base de données.
+        :param table_name: Nom de la table.
+        :return: Vrai si la table existe, faux sinon.
+        """
 
     @abstractmethod
     def get_table(self, table_name: str) -> Table:
@@ -357,4 +416,57 @@ class ORM(ABC):
         :return: Table.
         """
 
-        pass
+    @abstractmethod
+    def execute_query(self, query: str) -> list[tuple[Any, ...]]:
+        """
+        Exécute une requête SQL dans une transaction.
+        :param query: Requête SQL.
+        :return: Lignes retournées par la requête, vide si elle n'en retourne
+            pas.
+        """
+
+    @abstractmethod
+    def execute_queries(self, queries: Sequence[str]) -> list[list[tuple[Any, ...]]]:
+        """
+        Exécute des requêtes SQL dans l'ordre, sur une même connexion et dans
+        une seule transaction : une erreur annule tout le lot.
+        :param queries: Requêtes SQL.
+        :return: Lignes retournées par chaque requête, dans l'ordre des
+            requêtes.
+        """
+
+    @abstractmethod
+    def refresh_metadata(self, *table_names: str) -> None:
+        """
+        Relit le schéma de quelques tables, ou de toute la base, dans la base
+        de données ; les tables correspondantes sont retirées de
+        `_prereflected`.
+        :param table_names: Noms des tables. Toutes les tables si aucun nom.
+        """
+
+
+# Table d'échappement des identifiants SQL entre guillemets.
+_QUOTE_ESCAPES = str.maketrans({'"': '""'})
+
+# Fragments SQL constants des définitions de colonnes, calculés une seule fois.
+_EMPTY_SQL = ""
+_NOT_NULL_SQL = _sql.NOT_NULL
+_PRIMARY_KEY_SQL = _sql.PRIMARYKEY
+_UNIQUE_SQL = _sql.UNIQUE
+# Fragments indexés par le booléen de la contrainte (False -> 0, True -> 1).
+_NOT_NULL_SQL_BY_NULLABLE = (_NOT_NULL_SQL, _EMPTY_SQL)
+_PRIMARY_KEY_SQL_BY_FLAG = (_EMPTY_SQL, _PRIMARY_KEY_SQL)
+_UNIQUE_SQL_BY_FLAG = (_EMPTY_SQL, _UNIQUE_SQL)
+_FOREIGN_KEY_SQL = (
+    f"{_sql.FOREIGNKEY} (%s) {_sql.REFERENCES} %s (%s) "
+    f"{_sql.ON_DELETE} %s {_sql.ON_UPDATE} %s"
+)
+
+
+def _spaced(fragment: str | None) -> str:
+    """
+    Précède un fragment SQL non vide d'une espace.
+    :param fragment: Fragment SQL, éventuellement absent.
+    :return: Fragment SQL précédé d'une espace, ou chaîne vide.
+    """
+    return " " + fragment if fragment else _EMPTY_SQL
@@ -0,0 +1,34 @@
+"""
+Fragments SQL utilisés pour construire les requêtes de la couche ORM.
+"""
+
+from typing import Final
+
+SELECT: Final = "SELECT"
+INSERT: Final = "INSERT"
+UPDATE: Final = "UPDATE"
+DELETE: Final = "DELETE"
+CREATE: Final = "CREATE"
+DROP: Final = "DROP"
+ALTER: Final = "ALTER"
+ADD: Final = "ADD"
+TO: Final = "TO"
+FOREIGNKEY: Final = "FOREIGN KEY"
+REFERENCES: Final = "REFERENCES"
+PRIMARYKEY: Final = "PRIMARY KEY"
+UNIQUE: Final = "UNIQUE"
+CONSTRAINT: Final = "CONSTRAINT"
+NOT_NULL: Final = "NOT NULL"
+DEFAULT: Final = "DEFAULT"
+FROM: Final = "FROM"
+WHERE: Final = "WHERE"
+ALTER_TABLE: Final = "ALTER TABLE"
+TABLE: Final = "TABLE"
+ALTER_COLUMN: Final = "ALTER COLUMN"
+ADD_COLUMN: Final = "ADD COLUMN"
+DROP_COLUMN: Final = "DROP COLUMN"
+RENAME_COLUMN: Final = "RENAME COLUMN"
+ON_DELETE: Final = "ON DELETE"
+CASCADE: Final = "CASCADE"
+ON_UPDATE: Final = "ON UPDATE"
+RENAME_TO: Final = "RENAME TO"
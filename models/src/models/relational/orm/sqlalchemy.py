@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy.engine import Connection, Engine, create_engine
+from sqlalchemy.engine import Connection, Dialect, Engine, create_engine
 from sqlalchemy.exc import (
     NoSuchTableError as SQLAlchemyNoSuchTableError,
     SQLAlchemyError,
@@ -16,9 +16,16 @@ from sqlalchemy.schema import (
 from sqlalchemy.sql.expression import TextClause
 from sqlalchemy.sql import text
 from sqlalchemy.types import Integer, String, DateTime, Boolean, Float, Date, Text
-from typing import cast, Type, Any
-
-from models.relational.orm import ORM
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping, Sequence
+from datetime import date
+from functools import lru_cache
+from sys import intern
+import re
+import threading
+from typing import cast, Callable, Final, Type, Any
+
+from models.relational.orm import ORM, _sql
 from models.relational.metadata import (
     ColumnMeta,
     ColumnType,
@@ -28,6 +35,36 @@ from models.relational.metadata import (
 )
 
 
+_SQLALCHEMY_TYPE_BY_COLUMN_TYPE: Final[dict[ColumnType, type]] = {
+    ColumnType.INT: cast(type, Integer),
+    ColumnType.VARCHAR: cast(type, String),
+    ColumnType.TEXT: cast(type, Text),
+    ColumnType.DATE: cast(type, Date),
+    ColumnType.DATETIME: cast(type, DateTime),
+    ColumnType.BOOLEAN: cast(type, Boolean),
+    ColumnType.DECIMAL: cast(type, Float),
+}
+
+# Clés : `__visit_name__` des types SQLAlchemy en majuscules, qui coïncide avec
+# le nom SQL compilé pour les types de dialecte (INTEGER, VARCHAR, ...).
+_COLUMN_TYPE_BY_NAME: Final[dict[str, ColumnType]] = {
+    "INTEGER": ColumnType.INT,
+    "VARCHAR": ColumnType.VARCHAR,
+    "STRING": ColumnType.VARCHAR,
+    "TEXT": ColumnType.TEXT,
+    "DATE": ColumnType.DATE,
+    "DATETIME": ColumnType.DATETIME,
+    "BOOLEAN": ColumnType.BOOLEAN,
+    "DECIMAL": ColumnType.DECIMAL,
+    "NUMERIC": ColumnType.DECIMAL,
+    "FLOAT": ColumnType.DECIMAL,
+}
+
+# Types de colonne déjà résolus, par classe de type SQLAlchemy.
+_COLUMN_TYPE_BY_CLASS: dict[type, ColumnType] = {}
+
+
+@lru_cache(maxsize=None)
 def get_sqlalchemy_type(column_type: ColumnType, column_length: int | None) -> type:
     """
     Retourne le type SQLAlchemy correspondant à un type de colonne.
@@ -36,15 +73,7 @@ def get_sqlalchemy_type(column_type: ColumnType, column_length: int | None) -> t
     :return: Type SQLAlchemy.
     """
 
-    type_alchemy = {
-        ColumnType.INT: cast(type, Integer),
-        ColumnType.VARCHAR: cast(type, String),
-        ColumnType.TEXT: cast(type, Text),
-        ColumnType.DATE: cast(type, Date),
-        ColumnType.DATETIME: cast(type, DateTime),
-        ColumnType.BOOLEAN: cast(type, Boolean),
-        ColumnType.DECIMAL: cast(type, Float),
-    }[column_type]
+    type_alchemy = _SQLALCHEMY_TYPE_BY_COLUMN_TYPE[column_type]
     if column_length is not None and (type_alchemy == String or type_alchemy == Text):
         type_alchemy = cast(type, String(length=column_length))
     return type_alchemy
@@ -72,50 +101,228 @@ def get_column_type(column_type: type) -> ColumnType:
     :return: Type de colonne.
     """
 
-    column_type_str = str(column_type).split("(")[0]
+    type_class = type(column_type)
+    column_type_enum = _COLUMN_TYPE_BY_CLASS.get(type_class)
+    if column_type_enum is None:
+        column_type_name = getattr(column_type, "__visit_name__", "").upper()
+        column_type_enum = _COLUMN_TYPE_BY_NAME.get(column_type_name)
+        if column_type_enum is None:
+            column_type_enum = _COLUMN_TYPE_BY_NAME[str(column_type).partition("(")[0]]
+        _COLUMN_TYPE_BY_CLASS[type_class] = column_type_enum
+    return column_type_enum
+
+
+# Littéral SQL entre apostrophes, éventuellement suivi d'une conversion de type
+# (ex. `'abc'::character varying` sous PostgreSQL).
+_QUOTED_LITERAL: Final = re.compile(r"'((?:[^']|'')*)'(?:::[\w .()]+)?")
+
+# Écritures SQL des booléens, en minuscules.
+_BOOLEAN_BY_LITERAL: Final[dict[str, bool]] = {
+    "1": True,
+    "0": False,
+    "true": True,
+    "false": False,
+    "t": True,
+    "f": False,
+}
+
+
+def unquote_default(default: Any) -> Any:
+    """
+    Retire les apostrophes d'une valeur par défaut lue sous forme de littéral
+    SQL et dédouble ses apostrophes internes.
+    :param default: Valeur par défaut réfléchie.
+    :return: Valeur par défaut sans les apostrophes du littéral.
+    """
 
-    return {
-        "INTEGER": ColumnType.INT,
-        "VARCHAR": ColumnType.VARCHAR,
-        "TEXT": ColumnType.TEXT,
-        "DATE": ColumnType.DATE,
-        "DATETIME": ColumnType.DATETIME,
-        "BOOLEAN": ColumnType.BOOLEAN,
-        "DECIMAL": ColumnType.DECIMAL,
-    }[column_type_str]
+    if isinstance(default, str):
+        found = _QUOTED_LITERAL.fullmatch(default)
+        if found is not None:
+            return found[1].replace("''", "'")
+    return default
 
 
-def cast_default(default: Any | None, column_type: type) -> Any:
+def cast_boolean(value: Any) -> bool:
     """
-    Convertit la valeur par défaut d'une colonne.
+    Convertit une valeur booléenne lue dans la base de données.
+    :param value: Valeur (booléen, entier ou littéral SQL).
+    :return: Booléen.
+    """
+
+    if isinstance(value, bool):
+        return value
+    return _BOOLEAN_BY_LITERAL[str(value).lower()]
+
+
+_DEFAULT_CAST_BY_COLUMN_TYPE: Final[dict[ColumnType, Callable[[Any], Any]]] = {
+    ColumnType.INT: int,
+    ColumnType.VARCHAR: str,
+    ColumnType.TEXT: str,
+    ColumnType.DATETIME: str,
+    ColumnType.DATE: str,
+    ColumnType.BOOLEAN: cast_boolean,
+    ColumnType.DECIMAL: float,
+}
+
+
+def cast_default(default: Any | None, column_type: ColumnType) -> Any:
+    """
+    Convertit la valeur par défaut d'une colonne, telle que lue dans la base de
+    données : les littéraux SQL sont d'abord débarrassés de leurs apostrophes.
     :param default: Valeur par défaut.
     :param column_type: Type de la colonne.
     :return: Valeur par défaut.
     """
 
-    column_type_str = str(column_type).split("(")[0]
-
     if default is None:
         return None
 
     try:
-        if column_type_str == "INTEGER":
-            return int(default)
-        elif (
-            column_type_str == "VARCHAR"
-            or column_type_str == "TEXT"
-            or column_type_str == "DATETIME"
-            or column_type_str == "DATE"
-        ):
-            return str(default)
-        elif column_type_str == "BOOLEAN":
-            return bool(default)
-        elif column_type_str == "DECIMAL":
-            return float(default)
+        return _DEFAULT_CAST_BY_COLUMN_TYPE[column_type](unquote_default(default))
     except Exception:
         return None
 
 
+def _column_meta_fields(column: Column) -> dict[str, Any]:
+    """
+    Extrait d'une colonne réfléchie les champs communs à toutes les métadonnées
+    de colonne.
+    :param column: Colonne SQLAlchemy.
+    :return: Champs des métadonnées de la colonne.
+    """
+
+    type_column = get_column_type(cast(type, column.type))
+    server_default = column.server_default
+    return {
+        "name": intern(str(column.name)),
+        "type": type_column,
+        "length": int(getattr(column.type, "length", None) or 0) or None,
+        "nullable": column.nullable or False,
+        "primary_key": column.primary_key,
+        "unique": column.unique or False,
+        "default": (
+            cast_default(
+                getattr(server_default.arg, "text", server_default.arg), type_column
+            )
+            if isinstance(server_default, DefaultClause)
+            else None
+        ),
+    }
+
+
+# Types SQL compilés, indexés par nom de dialecte, type et longueur.
+_COMPILED_TYPES: dict[tuple[str, ColumnType, int | None], str] = {}
+_COMPILED_TYPES_MAXSIZE: Final = 256
+
+
+def get_compiled_type(
+    dialect: Dialect, column_type: ColumnType, column_length: int | None
+) -> str:
+    """
+    Retourne le type SQL compilé d'une colonne avec le dialecte d'un moteur.
+    Le cache est indexé sur le nom du dialecte et sert donc à toutes les bases
+    d'un même moteur.
+    :param dialect: Dialecte du moteur.
+    :param column_type: Type de colonne.
+    :param column_length: Longueur de la colonne.
+    :return: Type SQL compilé.
+    """
+
+    key = (dialect.name, column_type, column_length)
+    compiled = _COMPILED_TYPES.get(key)
+    if compiled is None:
+        type_alchemy: Any = get_sqlalchemy_type(column_type, column_length)
+        if isinstance(type_alchemy, type):
+            type_alchemy = type_alchemy()
+        compiled = str(type_alchemy.compile(dialect))
+        if len(_COMPILED_TYPES) < _COMPILED_TYPES_MAXSIZE:
+            _COMPILED_TYPES[key] = compiled
+    return compiled
+
+
+def to_sqlalchemy_column(column: ColumnMeta | ForeignKeyColumnMeta) -> Column:
+    """
+    Construit une colonne SQLAlchemy à partir de ses métadonnées.
+    La valeur par défaut est passée sous forme de littéral SQL, tel que la base de
+    données le restitue à la réflexion.
+    :param column: Métadonnées de la colonne.
+    :return: Colonne SQLAlchemy.
+    """
+
+    server_default = None
+    if isinstance(column.default, (str, date)):
+        server_default = text("'" + str(column.default).replace("'", "''") + "'")
+    elif column.default is not None:
+        server_default = text(str(column.default))
+    if isinstance(column, ForeignKeyColumnMeta):
+        return Column(
+            column.name,
+            get_sqlalchemy_type(column.type, column.length),
+            ForeignKey(
+                column.foreign_table_name + "." + column.foreign_column_name,
+                ondelete=column.on_delete,
+                onupdate=column.on_update,
+            ),
+            nullable=column.nullable,
+            primary_key=column.primary_key,
+            unique=column.unique,
+            server_default=server_default,
+        )
+    return Column(
+        column.name,
+        get_sqlalchemy_type(column.type, column.length),
+        nullable=column.nullable,
+        primary_key=column.primary_key,
+        unique=column.unique,
+        server_default=server_default,
+    )
+
+
+# Clichés de réflexion partagés, du moins au plus récemment utilisé. Ils sont
+# indexés par l'URL de connexion sans mot de passe et par le schéma.
+_REFLECTION_SNAPSHOTS: OrderedDict[tuple[str, str | None], MetaData] = OrderedDict()
+_REFLECTION_SNAPSHOTS_MAXSIZE: Final = 8
+_REFLECTION_SNAPSHOTS_LOCK = threading.Lock()
+
+
+def _snapshot_key(engine: Engine, schema: str | None) -> tuple[str, str | None]:
+    """
+    Retourne la clé du cliché de réflexion d'une base.
+    :param engine: Moteur de connexion à la base de données.
+    :param schema: Schéma/partition de la base de données.
+    :return: URL de connexion sans mot de passe et schéma.
+    """
+    return engine.url.render_as_string(hide_password=True), schema
+
+
+def _reflection_snapshot(engine: Engine, schema: str | None) -> MetaData:
+    """
+    Réfléchit les métadonnées d'une base, une seule fois par processus pour une
+    même URL et un même schéma.
+    Le cliché n'est jamais modifié : chaque instance en copie les tables dans
+    ses propres métadonnées. Il est retiré dès qu'une instance modifie ou
+    relit le schéma de la base, et seuls les derniers clichés utilisés sont
+    conservés. Une modification faite par un autre processus n'est vue
+    qu'après `SQLAlchemy.refresh_metadata`.
+    :param engine: Moteur de connexion de l'instance qui réfléchit la base.
+    :param schema: Schéma/partition de la base de données.
+    :return: Métadonnées réfléchies.
+    """
+
+    key = _snapshot_key(engine, schema)
+    with _REFLECTION_SNAPSHOTS_LOCK:
+        snapshot = _REFLECTION_SNAPSHOTS.get(key)
+        if snapshot is None:
+            snapshot = MetaData(schema=schema)
+            snapshot.reflect(bind=engine, views=False)
+            _REFLECTION_SNAPSHOTS[key] = snapshot
+            if len(_REFLECTION_SNAPSHOTS) > _REFLECTION_SNAPSHOTS_MAXSIZE:
+                _REFLECTION_SNAPSHOTS.popitem(last=False)
+        else:
+            _REFLECTION_SNAPSHOTS.move_to_end(key)
+        return snapshot
+
+
 class SQLAlchemy(ORM):
     """
     Classe de gestion de la couche ORM pour SQLAlchemy.
@@ -129,11 +336,15 @@ class SQLAlchemy(ORM):
         - engine: Moteur de connexion à la base de données.
         - schema: Schéma/partition de la base de données.
         - _metadata: Métadonnées de la base de données.
+        - _partial: Vrai si seules certaines tables ont été réfléchies.
+        - _schema_prefix: Préfixe des clés des tables dans les métadonnées.
     """
 
     engine: Engine
     schema: str | None
     _metadata: MetaData
+    _partial: bool
+    _schema_prefix: str
 
     class Table(ORM.Table):
         """
@@ -145,11 +356,15 @@ class SQLAlchemy(ORM):
             - columns: Colonnes de la table.
             - unique_constraints: Contraintes d'unicité.
             - orm: ORM.
+            - _dialect: Dialecte du moteur, pour compiler les types.
         """
 
+        __slots__ = ("_dialect",)
+
         _link_table: Table
         _name: str
-        columns: list[SQLAlchemy.Column | SQLAlchemy.ForeignKeyColumn]
+        _dialect: Dialect
+        columns: dict[str, SQLAlchemy.Column | SQLAlchemy.ForeignKeyColumn]
         unique_constraints: list[UniqueColumnsMeta]
         orm: SQLAlchemy
 
@@ -161,41 +376,44 @@ class SQLAlchemy(ORM):
             :return: Table.
             """
 
-            self._name = table.name
+            self._name = intern(str(table.name))
             self._link_table = table
             self.orm = sql_alchemy_instance
+            self._quoted_name = intern(self._quote_table_name(self._name))
+            self._dialect = sql_alchemy_instance.engine.dialect
 
-            self.columns = []
+            self.columns = {}
             self.unique_constraints = []
 
             for column in table.columns:
-                self.columns.append(
+                column_alchemy = (
                     SQLAlchemy.ForeignKeyColumn(column, self)
                     if column.foreign_keys
                     else SQLAlchemy.Column(column, self)
                 )
+                self.columns[column_alchemy.meta.name] = column_alchemy
 
             for unique_constraint in table.constraints:
-                if (
-                    isinstance(unique_constraint, UniqueConstraint)
-                    and unique_constraint.columns.__len__()
-                ):
-                    if unique_constraint.columns.__len__() == 1:
-                        for column_alchemy in self.columns:
-                            if (
-                                column_alchemy.meta.name
-                                == next(iter(unique_constraint.columns)).name
-                            ):
-                                column_alchemy.meta.unique = True
-                    else:
-                        self.unique_constraints.append(
-                            UniqueColumnsMeta(
-                                name=str(unique_constraint.name or ""),
-                                columns=set(
-                                    column.name for column in unique_constraint.columns
-                                ),
-                            )
+                if not isinstance(unique_constraint, UniqueConstraint):
+                    continue
+                constraint_size = len(unique_constraint.columns)
+                if constraint_size == 1:
+                    unique_column = self.columns.get(
+                        str(next(iter(unique_constraint.columns)).name)
+                    )
+                    if unique_column is not None:
+                        unique_column.meta = unique_column.meta.model_copy(
+                            update={"unique": True}
                         )
+                elif constraint_size:
+                    self.unique_constraints.append(
+                        UniqueColumnsMeta(
+                            name=str(unique_constraint.name or ""),
+                            columns=frozenset(
+                                column.name for column in unique_constraint.columns
+                            ),
+                        )
+                    )
 
         def add_column(
             self,
@@ -215,10 +433,9 @@ class SQLAlchemy(ORM):
 
             with self.orm.engine.connect() as connection:
                 try:
-                    column_type_compiled = cast_to_sqlalchemy_type(
-                        column.type, column.length
-                    ).compile(self.orm.engine.dialect)
-                    Verbs = SQLAlchemy.SQL_Verbs
+                    column_type_compiled = get_compiled_type(
+                        self._dialect, column.type, column.length
+                    )
                     AlchColumn = SQLAlchemy.Column
                     foreign_table_name = (
                         self._table_name_for_request(column.foreign_table_name)
@@ -226,17 +443,28 @@ class SQLAlchemy(ORM):
                         else ""
                     )
                     alter_statement = text(
-                        f"{Verbs.ALTER_TABLE.value} {self._table_name_for_request()} "
-                        f"{Verbs.ADD_COLUMN.value} {AlchColumn._name_for_request(column.name)} "
-                        f"{column_type_compiled} {AlchColumn._nullable_for_request(column.nullable)} "
-                        f"{AlchColumn._default_for_request(column.default)} "
-                        f"{AlchColumn._primary_key_for_request(column.primary_key)} "
-                        f"{AlchColumn._unique_for_request(column.unique)} "
-                        f"{AlchColumn._foreign_key_for_request(column, foreign_table_name)}"
+                        f"{_sql.ALTER_TABLE} {self._table_name_for_request()} "
+                        f"{_sql.ADD_COLUMN} "
+                        + AlchColumn._definition_for_request(
+                            column, column_type_compiled, foreign_table_name
+                        )
                     )
                     self.orm.execute(connection, alter_statement)
-                    self = self.orm.get_table(self.name)
-                    return self.get_column(column.name)
+                    link_column = to_sqlalchemy_column(column)
+                    # Un TEXT d'une longueur donnée est créé en VARCHAR : les
+                    # métadonnées suivent le type réellement stocké.
+                    stored_type = get_column_type(cast(type, link_column.type))
+                    if stored_type is not column.type:
+                        column = column.model_copy(update={"type": stored_type})
+                    self._link_table.append_column(link_column)
+                    self.orm._prereflected[self.name] = self
+                    added_column = (
+                        SQLAlchemy.ForeignKeyColumn(link_column, self, column)
+                        if isinstance(column, ForeignKeyColumnMeta)
+                        else SQLAlchemy.Column(link_column, self, column)
+                    )
+                    self.columns[added_column.meta.name] = added_column
+                    return added_column
                 except Exception as e:
                     raise self.AddColumnError(
                         f"Impossible de créer la colonne {column.name} dans la table {self.name}."
@@ -250,11 +478,9 @@ class SQLAlchemy(ORM):
             :param name: Nom de la colonne.
             :return: Colonne.
             """
-            if self.has_column(name):
-                column = self._link_table.columns[name]
-                if column.foreign_keys:
-                    return SQLAlchemy.ForeignKeyColumn(column, self)
-                return SQLAlchemy.Column(column, self)
+            column = self.columns.get(name)
+            if column is not None:
+                return cast(SQLAlchemy.Column | SQLAlchemy.ForeignKeyColumn, column)
             raise KeyError(f"La colonne {name} n'existe pas dans la table {self.name}.")
 
         def has_column(self, name: str) -> bool:
@@ -263,7 +489,7 @@ class SQLAlchemy(ORM):
             :param name: Nom de la colonne.
             :return: Vrai si la colonne existe, faux sinon.
             """
-            return name in self._link_table.columns
+            return name in self.columns
 
         @property
         def name(self) -> str:
@@ -283,12 +509,13 @@ class SQLAlchemy(ORM):
             try:
                 with self.orm.engine.connect() as connection:
                     alter_statement = text(
-                        f"{SQLAlchemy.SQL_Verbs.ALTER_TABLE.value} "
+                        f"{_sql.ALTER_TABLE} "
                         f"{self._table_name_for_request()} "
-                        f'{SQLAlchemy.SQL_Verbs.RENAME_TO.value} "{name}"'
+                        f"{_sql.RENAME_TO} {SQLAlchemy.Column._name_for_request(name)}"
                     )
-                    self.orm.execute(connection, alter_statement)
-                    self = self.orm.get_table(name)
+                    self.orm.execute(connection, alter_statement, self.name, name)
+                    self._name = name
+                    self._quoted_name = intern(self._quote_table_name(name))
             except SQLAlchemyError as e:
                 raise self.orm.SQLExecutionError(
                     f"Impossible de renommer la table {self._name} en {name}."
@@ -299,45 +526,35 @@ class SQLAlchemy(ORM):
         Classe de gestion des colonnes.
         """
 
+        __slots__ = ()
+
         meta: ColumnMeta
         _link_column: Column
         table: SQLAlchemy.Table
 
-        def __init__(self, column: Column, table: SQLAlchemy.Table) -> None:
+        def __init__(
+            self,
+            column: Column,
+            table: SQLAlchemy.Table,
+            meta: ColumnMeta | None = None,
+        ) -> None:
             """
             Crée une colonne.
             :param column: Colonne à créer.
             :param table: Table de la colonne.
+            :param meta: Métadonnées déjà validées de la colonne ; lues sur la
+                colonne SQLAlchemy si None.
             :return: Colonne.
             """
 
             self._link_column = column
 
-            name = column.name
-            type_column = get_column_type(cast(type, column.type))
-            length = int(getattr(column.type, "length", None) or 0) or None
-            nullable = column.nullable or False
-            primary_key = column.primary_key
-            unique = column.unique or False
-            default = (
-                cast_default(
-                    getattr(
-                        column.server_default.arg, "text", column.server_default.arg
-                    ),
-                    cast(type, column.type),
-                )
-                if isinstance(column.server_default, DefaultClause)
-                else None
-            )
-            self.meta = ColumnMeta(
-                name=name,
-                type=type_column,
-                length=length,
-                nullable=nullable,
-                primary_key=primary_key,
-                unique=unique,
-                default=default,
+            self.meta = (
+                meta
+                if meta is not None
+                else ColumnMeta.from_trusted(**_column_meta_fields(column))
             )
+            self._quoted_name = SQLAlchemy.Column._name_for_request(self.meta.name)
             self.table = table
 
         def set_name(self, name: str) -> SQLAlchemy.Column:
@@ -349,14 +566,14 @@ class SQLAlchemy(ORM):
             try:
                 with self.table.orm.engine.connect() as connection:
                     alter_statement = text(
-                        f"{SQLAlchemy.SQL_Verbs.ALTER_TABLE.value} "
-                        f"{self.table._table_name_for_request()}"
-                        f"{SQLAlchemy.SQL_Verbs.RENAME_COLUMN.value} "
-                        f"{SQLAlchemy.Column._name_for_request(self.meta.name)} "
-                        f"{SQLAlchemy.SQL_Verbs.TO.value} "
+                        f"{_sql.ALTER_TABLE} "
+                        f"{self.table._table_name_for_request()} "
+                        f"{_sql.RENAME_COLUMN} "
+                        f"{self._quoted_name} "
+                        f"{_sql.TO} "
                         f"{SQLAlchemy.Column._name_for_request(name)}"
                     )
-                    self.table.orm.execute(connection, alter_statement)
+                    self.table.orm.execute(connection, alter_statement, self.table.name)
                     table = self.table.orm.get_table(self.table.name)
                     self = cast(SQLAlchemy.Column, table.get_column(name))
                     return self
@@ -370,55 +587,39 @@ class SQLAlchemy(ORM):
         Classe de gestion des colonnes de clé étrangère.
         """
 
+        __slots__ = ()
+
         _link_column: Column
         table: SQLAlchemy.Table
 
-        def __init__(self, column: Column, table: SQLAlchemy.Table) -> None:
+        def __init__(
+            self,
+            column: Column,
+            table: SQLAlchemy.Table,
+            meta: ForeignKeyColumnMeta | None = None,
+        ) -> None:
             """
             Crée une colonne.
             :param column: Colonne à créer.
             :param table: Table de la colonne.
+            :param meta: Métadonnées déjà validées de la colonne ; lues sur la
+                colonne SQLAlchemy si None.
             :return: Colonne.
             """
 
-            foreign_key = next(iter(column.foreign_keys))
-
             self._link_column = column
 
-            name = column.name
-            type_column = get_column_type(cast(type, column.type))
-            length = int(getattr(column.type, "length", None) or 0) or None
-            nullable = column.nullable or False
-            primary_key = column.primary_key
-            unique = column.unique or False
-            default = (
-                cast_default(
-                    getattr(
-                        column.server_default.arg, "text", column.server_default.arg
-                    ),
-                    cast(type, column.type),
+            if meta is None:
+                foreign_key = next(iter(column.foreign_keys))
+                meta = ForeignKeyColumnMeta.from_trusted(
+                    **_column_meta_fields(column),
+                    foreign_table_name=intern(str(foreign_key.column.table.name)),
+                    foreign_column_name=intern(str(foreign_key.column.name)),
+                    on_delete=ForeignKeyAction.create(foreign_key.ondelete or ""),
+                    on_update=ForeignKeyAction.create(foreign_key.onupdate or ""),
                 )
-                if isinstance(column.server_default, DefaultClause)
-                else None
-            )
-            foreign_table_name = foreign_key.column.table.name
-            foreign_column_name = foreign_key.column.name
-            on_delete = ForeignKeyAction.create(foreign_key.ondelete or "")
-            on_update = ForeignKeyAction.create(foreign_key.onupdate or "")
-
-            self.meta = ForeignKeyColumnMeta(
-                name=name,
-                type=type_column,
-                length=length,
-                nullable=nullable,
-                primary_key=primary_key,
-                unique=unique,
-                default=default,
-                foreign_table_name=foreign_table_name,
-                foreign_column_name=foreign_column_name,
-                on_delete=on_delete,
-                on_update=on_update,
-            )
+            self.meta = meta
+            self._quoted_name = SQLAlchemy.Column._name_for_request(self.meta.name)
             self.table = table
 
         def set_name(self, name: str) -> SQLAlchemy.ForeignKeyColumn:
@@ -434,6 +635,8 @@ class SQLAlchemy(ORM):
         Classe de gestion des contraintes d'unicité.
         """
 
+        __slots__ = ("link_constraint",)
+
         link_constraint: UniqueConstraint
 
         def __init__(self, constraint: UniqueConstraint) -> None:
@@ -445,7 +648,7 @@ class SQLAlchemy(ORM):
 
             self.link_constraint = constraint
             self.name = str(constraint.name or "")
-            self.columns = set(column.name for column in constraint.columns)
+            self.columns = frozenset(column.name for column in constraint.columns)
 
     class NoSuchTableError(SQLAlchemyNoSuchTableError):
         """
@@ -454,17 +657,54 @@ class SQLAlchemy(ORM):
 
         pass
 
-    def __init__(self, engine_url: str, schema: str) -> None:
+    def __init__(
+        self,
+        engine_url: str,
+        schema: str,
+        only: list[str] | None = None,
+        share_reflection: bool = False,
+    ) -> None:
         """
         Constructeur de la couche ORM pour SQLAlchemy.
+        La réflexion passe par les requêtes multi-tables de SQLAlchemy 2 : un
+        aller-retour par type d'information, et non par table.
         :param engine_url: URL de connexion à la base de données.
         :param schema: Schéma/partition de la base de données.
+        :param only: Tables à réfléchir d'emblée ; les autres le sont à leur
+            première demande. Toutes les tables sont réfléchies si None.
+        :param share_reflection: Copie les tables d'un cliché réfléchi une
+            seule fois par processus pour la même URL et le même schéma, au
+            lieu de réfléchir la base. Ignoré avec `only`.
         """
 
-        self.engine = create_engine(engine_url)
         self.schema = schema or None
-        self._metadata = MetaData(schema=schema)
-        self._metadata.reflect(bind=self.engine)
+        self._table_name_template = (
+            SQLAlchemy.Column._name_for_request(self.schema)
+            .replace("{", "{{")
+            .replace("}", "}}")
+            + ".{}"
+            if self.schema
+            else "{}"
+        )
+        self._prereflected = {}
+        self._partial = only is not None
+        self._schema_prefix = f"{self.schema}." if self.schema else ""
+        self.engine = create_engine(engine_url)
+        self._metadata = MetaData(schema=self.schema)
+        if share_reflection and only is None:
+            snapshot = _reflection_snapshot(self.engine, self.schema)
+            for table in snapshot.sorted_tables:
+                table.to_metadata(self._metadata)
+            return
+        self._metadata.reflect(bind=self.engine, only=only, views=False)
+
+    def _discard_snapshot(self) -> None:
+        """
+        Retire le cliché de réflexion de la base après une modification de son
+        schéma : les prochaines instances la réfléchissent à nouveau.
+        """
+        with _REFLECTION_SNAPSHOTS_LOCK:
+            _REFLECTION_SNAPSHOTS.pop(_snapshot_key(self.engine, self.schema), None)
 
     def create_table(
         self,
@@ -480,89 +720,100 @@ class SQLAlchemy(ORM):
         :return: Table.
         """
         try:
-            has_primary_key = False
-            for column in columns:
-                if column.primary_key:
-                    has_primary_key = True
-                    break
-            if not has_primary_key:
+            if not any(column.primary_key for column in columns):
                 raise self.CreateTableError(
                     f"Impossible de créer la table {table_name}.\n"
                     "Aucune colonne primaire n'a été spécifiée."
                 )
+            exists = self.has_table(table_name)
+            positions = {column.name: index for index, column in enumerate(columns)}
             table = Table(
                 table_name,
                 self._metadata,
-                *[
-                    (
-                        Column(
-                            column.name,
-                            get_sqlalchemy_type(column.type, column.length),
-                            ForeignKey(
-                                column.foreign_table_name
-                                + "."
-                                + column.foreign_column_name,
-                                ondelete=column.on_delete.value,
-                                onupdate=column.on_update.value,
-                            ),
-                            nullable=column.nullable,
-                            primary_key=column.primary_key,
-                            unique=column.unique,
-                            server_default=column.default,
-                        )
-                        if isinstance(column, ForeignKeyColumnMeta)
-                        else Column(
-                            column.name,
-                            get_sqlalchemy_type(column.type, column.length),
-                            nullable=column.nullable,
-                            primary_key=column.primary_key,
-                            unique=column.unique,
-                            server_default=column.default,
-                        )
-                    )
-                    for column in columns
-                ],
+                *[to_sqlalchemy_column(column) for column in columns],
                 *[
                     UniqueConstraint(
-                        *[
-                            column.name
-                            for column in columns
-                            if column.name in unique_constraint.columns
-                        ],
+                        *sorted(
+                            unique_constraint.columns & positions.keys(),
+                            key=positions.__getitem__,
+                        ),
                         name=unique_constraint.name,
                     )
                     for unique_constraint in (unique_constraints_columns or [])
                 ],
                 extend_existing=True,
             )
-            table.create(bind=self.engine, checkfirst=True)
-            return self.Table(table, self)
+            if not exists:
+                with self.engine.begin() as connection:
+                    table.create(bind=connection, checkfirst=False)
+                self._discard_snapshot()
+            table_orm = self.Table(table, self)
+            self._prereflected[table_name] = table_orm
+            return table_orm
         except Exception as e:
             raise self.CreateTableError(
                 f"Impossible de créer la table {table_name}."
             ) from e
 
-    def get_tables(self) -> dict[str, ORM.Table]:
+    def get_tables(self) -> Mapping[str, ORM.Table]:
         """
         Récupère les tables de la base de données.
         :return: Tables.
         """
 
-        return {
-            table_name: self.Table(table, self)
-            for table_name, table in self._metadata.tables.items()
+        if self._partial:
+            self.refresh_metadata()
+
+        return LazyTables(self)
+
+    def reflect_many(self, table_names: list[str]) -> dict[str, ORM.Table]:
+        """
+        Récupère plusieurs tables de la base de données en une seule réflexion.
+        Les tables récupérées sont conservées dans `_prereflected`.
+        :param table_names: Noms des tables.
+        :return: Tables.
+        """
+
+        self._metadata.reflect(bind=self.engine, only=table_names, extend_existing=True)
+        for table_name in table_names:
+            self._prereflected.pop(table_name, None)
+        tables: dict[str, ORM.Table] = {
+            table_name: self.get_table(table_name) for table_name in table_names
         }
+        return tables
 
     def get_table(self, table_name: str) -> SQLAlchemy.Table:
         """
         Récupère une table de la base de données.
+        La table construite est conservée dans `_prereflected` jusqu'à la
+        prochaine requête DDL qui la concerne.
         :param table_name: Nom de la table.
         :return: Table.
         """
-        table_name = f"{self.schema}.{table_name}" if self.schema else table_name
-        if table_name not in self._metadata.tables:
+        table = self._prereflected.get(table_name)
+        if table is not None:
+            return cast(SQLAlchemy.Table, table)
+        if not self.has_table(table_name):
             raise self.NoSuchTableError(f"La table {table_name} n'existe pas.")
-        return self.Table(self._metadata.tables[table_name], self)
+        table = self.Table(
+            self._metadata.tables[self._schema_prefix + table_name], self
+        )
+        self._prereflected[table_name] = table
+        return table
+
+    def has_table(self, table_name: str) -> bool:
+        """
+        Vérifie si une table existe dans la base de données.
+        Les métadonnées réfléchies servent de cache : aucune requête n'est émise,
+        sauf pour réfléchir une table encore inconnue après une réflexion
+        partielle.
+        :param table_name: Nom de la table.
+        :return: Vrai si la table existe, faux sinon.
+        """
+        key = self._schema_prefix + table_name
+        if key not in self._metadata.tables and self._partial:
+            self.refresh_tables(table_name)
+        return key in self._metadata.tables
 
     @staticmethod
     def get_no_such_table_error() -> Type[SQLAlchemyNoSuchTableError]:
@@ -573,23 +824,141 @@ class SQLAlchemy(ORM):
 
         return SQLAlchemyNoSuchTableError
 
-    def refresh_metadata(self) -> None:
+    def refresh_metadata(self, *table_names: str) -> None:
         """
         Rafraîchit les métadonnées de la base de données.
+        Avec des noms de tables, seules ces tables sont rafraîchies ; sinon la
+        base entière est réfléchie à nouveau, dans le même objet `MetaData`.
+        :param table_names: Noms des tables à rafraîchir.
         """
-        self._metadata = MetaData(schema=self.schema)
-        self._metadata.reflect(bind=self.engine)
-
-    def execute(self, connection: Connection, statement: TextClause) -> None:
+        self._discard_snapshot()
+        if table_names:
+            self.refresh_tables(*table_names)
+            return
+        self._prereflected.clear()
+        self._partial = False
+        self._metadata.clear()
+        self._metadata.reflect(bind=self.engine, views=False)
+
+    def refresh_tables(self, *table_names: str) -> None:
+        """
+        Rafraîchit les métadonnées de quelques tables seulement.
+        Les tables qui y font référence sont rafraîchies avec elles, et les noms
+        absents de la base de données sont simplement retirés des métadonnées.
+        :param table_names: Noms des tables.
+        """
+        names = set(table_names)
+        stale = [
+            table
+            for table in self._metadata.tables.values()
+            if table.name in names
+            or any(
+                constraint.referred_table.name in names
+                for constraint in table.foreign_key_constraints
+            )
+        ]
+        for table in stale:
+            names.add(table.name)
+            self._metadata.remove(table)
+        for table_name in names:
+            self._prereflected.pop(table_name, None)
+        self._metadata.reflect(
+            bind=self.engine, only=lambda table_name, _: table_name in names
+        )
+
+    def execute(
+        self, connection: Connection, statement: TextClause, *table_names: str
+    ) -> None:
         """
         Exécute une requête SQL.
+        Seules les métadonnées des tables modifiées sont rafraîchies ;
+        `refresh_metadata` reste disponible pour une réflexion complète.
         :param connection: Connexion à la base de données.
         :param statement: Requête SQL.
+        :param table_names: Noms des tables modifiées par la requête.
         """
         connection.execute(statement)
         connection.commit()
-        self.refresh_metadata()
+        self._discard_snapshot()
+        if table_names:
+            self.refresh_tables(*table_names)
+
+    def execute_query(self, query: str) -> list[tuple[Any, ...]]:
+        """
+        Exécute une requête SQL dans une transaction.
+        Les métadonnées ne sont pas rafraîchies : après une requête de
+        définition, voir `refresh_metadata`.
+        :param query: Requête SQL.
+        :return: Lignes retournées par la requête, vide si elle n'en retourne
+            pas.
+        """
+        return self.execute_queries([query])[0]
+
+    def execute_queries(self, queries: Sequence[str]) -> list[list[tuple[Any, ...]]]:
+        """
+        Exécute des requêtes SQL dans l'ordre, sur une même connexion et dans
+        une seule transaction : une erreur annule tout le lot.
+        Les métadonnées ne sont pas rafraîchies : après une requête de
+        définition, voir `refresh_metadata`.
+        :param queries: Requêtes SQL.
+        :return: Lignes retournées par chaque requête, dans l'ordre des
+            requêtes.
+        """
+        results: list[list[tuple[Any, ...]]] = []
+        query = ""
+        try:
+            with self.engine.begin() as connection:
+                for query in queries:
+                    result = connection.execute(text(query))
+                    results.append(
+                        [tuple(row) for row in result] if result.returns_rows else []
+                    )
+        except SQLAlchemyError as e:
+            raise self.SQLExecutionError(
+                f"Impossible d'exécuter la requête {query}."
+            ) from e
+        return results
 
     def close_session(self) -> None:
         """Ferme la connexion à la base de données."""
         self.engine.dispose()
+
+
+class LazyTables(Mapping[str, ORM.Table]):
+    """
+    Tables de la base de données, vues en lecture seule à travers les
+    métadonnées réfléchies.
+    Les clés sont les noms des tables, sans le préfixe du schéma ; les tables ne
+    sont enveloppées qu'à leur lecture, par `SQLAlchemy.get_table`, dont le
+    cache est le seul à les conserver. Les tables sont créées et supprimées par
+    la couche ORM, jamais à travers cette vue.
+    """
+
+    __slots__ = ("_orm",)
+
+    _orm: SQLAlchemy
+
+    def __init__(self, orm: SQLAlchemy) -> None:
+        """
+        Crée la vue des tables.
+        :param orm: Instance de la couche ORM pour SQLAlchemy.
+        """
+
+        self._orm = orm
+
+    def __getitem__(self, table_name: str) -> ORM.Table:
+        if table_name not in self:
+            raise KeyError(table_name)
+        return self._orm.get_table(table_name)
+
+    def __contains__(self, table_name: object) -> bool:
+        return (
+            isinstance(table_name, str)
+            and self._orm._schema_prefix + table_name in self._orm._metadata.tables
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(tuple(table.name for table in self._orm._metadata.tables.values()))
+
+    def __len__(self) -> int:
+        return len(self._orm._metadata.tables)
@@ -0,0 +1,145 @@
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from models.relational.db_schema import Database, Table
+from models.relational.metadata import ColumnMeta, ColumnType
+from models.relational.orm.sqlalchemy import SQLAlchemy
+
+
+def test_invalidate_reads_external_schema_change(tmp_path: Path) -> None:
+    """
+    ÉTANT DONNÉ une table déjà chargée par une base de données,
+    QUAND une colonne lui est ajoutée hors de cette instance puis que la table
+    est invalidée,
+    ALORS la table récupérée porte la nouvelle colonne.
+    """
+
+    # Base de données
+    db_path = tmp_path / "invalidate.db"
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("CREATE TABLE T (id INTEGER PRIMARY KEY, a TEXT)")
+    db = Database[SQLAlchemy, SQLAlchemy.Table](db_path, SQLAlchemy)
+    assert list(db.get_orm_table("T").columns) == ["id", "a"]
+
+    # Modification externe du schéma
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("ALTER TABLE T ADD COLUMN b TEXT")
+    db.invalidate("T")
+
+    # Table relue
+    assert list(db.get_orm_table("T").columns) == ["id", "a", "b"]
+    db.disconnection()
+
+
+def test_execute_returns_rows(tmp_path: Path) -> None:
+    """
+    ÉTANT DONNÉ une base de données SQLite,
+    QUAND une requête y est exécutée,
+    ALORS elle est exécutée par la couche ORM et ses lignes sont retournées.
+    """
+
+    # Base de données
+    db_path = tmp_path / "execute.db"
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("CREATE TABLE T (id INTEGER PRIMARY KEY, a TEXT)")
+    db = Database[SQLAlchemy, SQLAlchemy.Table](db_path, SQLAlchemy)
+
+    # Requêtes
+    assert db.execute("INSERT INTO T (a) VALUES ('x')") == []
+    assert db.execute("SELECT id, a FROM T") == [(1, "x")]
+    db.disconnection()
+
+
+def test_execute_many_returns_results_in_order(tmp_path: Path) -> None:
+    """
+    ÉTANT DONNÉ une base de données SQLite,
+    QUAND un lot de requêtes y est exécuté,
+    ALORS les requêtes sont exécutées dans l'ordre, les lignes de chacune sont
+    retournées dans l'ordre du lot, et un lot en échec est annulé en entier.
+    """
+
+    # Base de données
+    db_path = tmp_path / "execute_many.db"
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("CREATE TABLE T (id INTEGER PRIMARY KEY, a TEXT)")
+        connection.executemany("INSERT INTO T (a) VALUES (?)", [("x",), ("y",)])
+    db = Database[SQLAlchemy, SQLAlchemy.Table](db_path, SQLAlchemy)
+
+    # Lot de requêtes
+    results = asyncio.run(
+        db.execute_many(
+            [
+                "SELECT a FROM T WHERE id = 2",
+                "INSERT INTO T (a) VALUES ('z')",
+                "SELECT COUNT(*) FROM T",
+                "SELECT a FROM T WHERE id = 3",
+            ]
+        )
+    )
+    assert results == [[("y",)], [], [(3,)], [("z",)]]
+
+    # Lot en échec, annulé en entier
+    with pytest.raises(SQLAlchemy.SQLExecutionError):
+        asyncio.run(
+            db.execute_many(["INSERT INTO T (a) VALUES ('w')", "SELECT * FROM U"])
+        )
+    assert db.execute("SELECT COUNT(*) FROM T") == [(3,)]
+    db.disconnection()
+
+
+def test_add_column_from_several_threads(tmp_path: Path) -> None:
+    """
+    ÉTANT DONNÉ deux tables d'une même base de données,
+    QUAND des colonnes leur sont ajoutées depuis deux fils d'exécution,
+    ALORS les ajouts, exécutés l'un après l'autre sous le verrou du schéma,
+    laissent chaque table avec ses colonnes, y compris après une nouvelle
+    lecture du schéma.
+    """
+
+    # Base de données
+    db_path = tmp_path / "add_columns.db"
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("CREATE TABLE T1 (id INTEGER PRIMARY KEY)")
+        connection.execute("CREATE TABLE T2 (id INTEGER PRIMARY KEY)")
+    db = Database[SQLAlchemy, SQLAlchemy.Table](db_path, SQLAlchemy)
+    tables = [
+        Table[
+            SQLAlchemy, SQLAlchemy.Table, SQLAlchemy.Column, SQLAlchemy.ForeignKeyColumn
+        ](name, db)
+        for name in ("T1", "T2")
+    ]
+
+    # Ajouts depuis deux fils d'exécution
+    def add_all(
+        table: Table[
+            SQLAlchemy, SQLAlchemy.Table, SQLAlchemy.Column, SQLAlchemy.ForeignKeyColumn
+        ],
+    ) -> None:
+        for index in range(5):
+            table.add_column(
+                ColumnMeta(
+                    name=f"c{index}",
+                    type=ColumnType.INT,
+                    length=None,
+                    nullable=True,
+                    primary_key=False,
+                    unique=False,
+                )
+            )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(add_all, tables))
+    expected = ["id"] + [f"c{index}" for index in range(5)]
+    for table in tables:
+        assert [column.name for column in table.columns] == expected
+    db.disconnection()
+
+    # Nouvelle lecture du schéma
+    db = Database[SQLAlchemy, SQLAlchemy.Table](db_path, SQLAlchemy)
+    for name in ("T1", "T2"):
+        assert list(db.get_orm_table(name).columns) == expected
+    db.disconnection()
@@ -0,0 +1,114 @@
+from datetime import datetime
+from typing import Any
+
+from models.relational.metadata import ColumnMeta, ColumnType, UniqueColumnsMeta
+
+
+def test_column_meta_datetime_default() -> None:
+    """
+    ÉTANT DONNÉ une valeur par défaut DATETIME dans l'un des formats supportés,
+    QUAND les métadonnées de la colonne sont initialisées,
+    ALORS la valeur par défaut est convertie en datetime.
+    """
+
+    for value in (
+        "12/03/2020 10:11:12",
+        "12-03-2020 10:11:12",
+        "2020/03/12 10:11:12",
+        "2020-03-12 10:11:12",
+    ):
+        # Métadonnées de la colonne
+        column_meta = ColumnMeta(
+            name="created_at",
+            type=ColumnType.DATETIME,
+            length=None,
+            nullable=False,
+            primary_key=False,
+            unique=False,
+            default=value,
+        )
+
+        # Valeur par défaut
+        assert column_meta.default == datetime(2020, 3, 12, 10, 11, 12)
+
+
+def test_column_meta_from_trusted_matches_validation() -> None:
+    """
+    ÉTANT DONNÉ des métadonnées de colonne valides,
+    QUAND elles sont construites sans validation par `from_trusted`,
+    ALORS elles sont égales à celles construites avec validation.
+    """
+
+    for column_type, default in (
+        (ColumnType.INT, 5),
+        (ColumnType.VARCHAR, "abc"),
+        (ColumnType.BOOLEAN, False),
+        (ColumnType.DECIMAL, 1.5),
+        (ColumnType.DATE, "2020-03-12"),
+        (ColumnType.DATE, "12/03/2020"),
+        (ColumnType.DATETIME, "2020-03-12 10:11:12"),
+        (ColumnType.DATE, None),
+    ):
+        # Valeurs des champs
+        data: dict[str, Any] = {
+            "name": "value",
+            "type": column_type,
+            "length": None,
+            "nullable": True,
+            "primary_key": False,
+            "unique": False,
+            "default": default,
+        }
+
+        # Métadonnées construites avec et sans validation
+        assert ColumnMeta.from_trusted(**data) == ColumnMeta(**data)
+
+
+def test_column_meta_from_trusted_normalises_reflected_dates() -> None:
+    """
+    ÉTANT DONNÉ des valeurs par défaut DATE et DATETIME lues dans la base de
+    données, désignant la date courante ou dans un format non reconnu,
+    QUAND les métadonnées sont construites par `from_trusted`,
+    ALORS la date courante n'est pas figée et aucune erreur n'est levée.
+    """
+
+    # Date et heure courantes
+    for column_type, default in (
+        (ColumnType.DATE, "CURRENT_DATE"),
+        (ColumnType.DATETIME, "CURRENT_TIMESTAMP"),
+    ):
+        column_meta = ColumnMeta.from_trusted(
+            name="opened_on",
+            type=column_type,
+            length=None,
+            nullable=False,
+            primary_key=False,
+            unique=False,
+            default=default,
+        )
+        assert column_meta.default == default
+
+    # Format non reconnu, conservé tel quel
+    column_meta = ColumnMeta.from_trusted(
+        name="updated_at",
+        type=ColumnType.DATETIME,
+        length=None,
+        nullable=False,
+        primary_key=False,
+        unique=False,
+        default="2020-03-12T10:11:12.5",
+    )
+    assert column_meta.default == "2020-03-12T10:11:12.5"
+
+
+def test_unique_columns_meta_is_hashable() -> None:
+    """
+    ÉTANT DONNÉ deux métadonnées de colonnes uniques de mêmes nom et colonnes,
+    QUAND elles sont hachées,
+    ALORS elles ont le même hachage et sont égales.
+    """
+
+    unique = UniqueColumnsMeta(name="uq_code", columns=frozenset({"Code", "Year"}))
+    same = UniqueColumnsMeta(name="uq_code", columns=frozenset({"Year", "Code"}))
+    assert hash(unique) == hash(same)
+    assert {unique, same} == {unique}
@@ -0,0 +1,481 @@
+import sqlite3
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.types import Float, Numeric, String
+
+from models.relational.metadata import (
+    ColumnMeta,
+    ColumnType,
+    ForeignKeyAction,
+    ForeignKeyColumnMeta,
+)
+from models.relational.orm.sqlalchemy import (
+    _REFLECTION_SNAPSHOTS,
+    _REFLECTION_SNAPSHOTS_MAXSIZE,
+    SQLAlchemy,
+    get_column_type,
+    get_compiled_type,
+)
+
+
+def test_get_column_type_generic_types() -> None:
+    """
+    ÉTANT DONNÉ des types SQLAlchemy génériques utilisés à la création des tables,
+    QUAND le type de colonne correspondant est recherché,
+    ALORS le type de colonne est retrouvé.
+    """
+
+    # Types de colonne
+    assert get_column_type(Float()) == ColumnType.DECIMAL  # type: ignore[arg-type]
+    assert get_column_type(Numeric(10, 2)) == ColumnType.DECIMAL  # type: ignore[arg-type]
+    assert get_column_type(String(10)) == ColumnType.VARCHAR  # type: ignore[arg-type]
+
+
+def test_get_compiled_type_uses_engine_dialect() -> None:
+    """
+    ÉTANT DONNÉ le dialecte d'un moteur,
+    QUAND le type SQL d'une colonne est compilé,
+    ALORS il l'est avec ce dialecte.
+    """
+
+    # Dialecte du moteur
+    dialect = create_engine("sqlite://").dialect
+
+    # Types compilés
+    assert get_compiled_type(dialect, ColumnType.VARCHAR, 10) == "VARCHAR(10)"
+    assert get_compiled_type(dialect, ColumnType.BOOLEAN, None) == "BOOLEAN"
+
+
+def test_add_column_defaults_reflected_again(tmp_path: Path) -> None:
+    """
+    ÉTANT DONNÉ une table à laquelle sont ajoutées des colonnes DATE, DATETIME,
+    VARCHAR et BOOLEAN avec une valeur par défaut,
+    QUAND la table est réfléchie à nouveau par une autre instance,
+    ALORS les valeurs par défaut réfléchies sont celles des colonnes ajoutées.
+    """
+
+    # Table
+    engine_url = f"sqlite:///{tmp_path / 'defaults.db'}"
+    orm = SQLAlchemy(engine_url, "")
+    table = orm.create_table(
+        "Schools",
+        [
+            ColumnMeta(
+                name="Id",
+                type=ColumnType.INT,
+                length=None,
+                nullable=False,
+                primary_key=True,
+                unique=True,
+            )
+        ],
+    )
+
+    # Colonnes ajoutées
+    added = [
+        ColumnMeta(
+            name="OpenedOn",
+            type=ColumnType.DATE,
+            length=None,
+            nullable=False,
+            primary_key=False,
+            unique=False,
+            default="2020-01-02",
+        ),
+        ColumnMeta(
+            name="UpdatedAt",
+            type=ColumnType.DATETIME,
+            length=None,
+            nullable=False,
+            primary_key=False,
+            unique=False,
+            default="2020-01-02 10:11:12",
+        ),
+        ColumnMeta(
+            name="Motto",
+            type=ColumnType.VARCHAR,
+            length=20,
+            nullable=False,
+            primary_key=False,
+            unique=False,
+            default="l'école",
+        ),
+        ColumnMeta(
+            name="Closed",
+            type=ColumnType.BOOLEAN,
+            length=None,
+            nullable=False,
+            primary_key=False,
+            unique=False,
+            default=False,
+        ),
+    ]
+    for column in added:
+        table.add_column(column)
+    orm.close_session()
+
+    # Table réfléchie à nouveau
+    reflected = SQLAlchemy(engine_url, "").get_table("Schools")
+    for column in added:
+        assert reflected.get_column(column.name).meta.default == column.default
+
+
+def test_reflected_current_date_defaults_kept(tmp_path: Path) -> None:
+    """
+    ÉTANT DONNÉ une table dont des colonnes DATE et DATETIME ont pour valeur
+    par défaut la date courante ou un littéral,
+    QUAND la table est réfléchie,
+    ALORS la date courante est conservée telle quelle et le littéral est
+    converti.
+    """
+
+    # Table
+    db_path = tmp_path / "current_date.db"
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(
+            "CREATE TABLE Schools (Id INTEGER PRIMARY KEY,"
+            " OpenedOn DATE DEFAULT CURRENT_DATE,"
+            " UpdatedAt DATETIME DEFAULT CURRENT_TIMESTAMP,"
+            " ClosedOn DATE DEFAULT '2020-01-02')"
+        )
+    orm = SQLAlchemy(f"sqlite:///{db_path}", "")
+
+    # Valeurs par défaut réfléchies
+    columns = orm.get_table("Schools").columns
+    assert columns["OpenedOn"].meta.default == "CURRENT_DATE"
+    assert columns["UpdatedAt"].meta.default == "CURRENT_TIMESTAMP"
+    assert columns["ClosedOn"].meta.default == date(2020, 1, 2)
+    orm.close_session()
+
+
+def test_add_column_keeps_metadata(tmp_path: Path) -> None:
+    """
+    ÉTANT DONNÉ une table existante,
+    QUAND des colonnes avec une valeur par défaut lui sont ajoutées,
+    ALORS les colonnes retournées portent les métadonnées passées, sans
+    conversion de leur valeur par défaut.
+    """
+
+    # Table
+    orm = SQLAlchemy(f"sqlite:///{tmp_path / 'add_column.db'}", "")
+    table = orm.create_table(
+        "Schools",
+        [
+            ColumnMeta(
+                name="Id",
+                type=ColumnType.INT,
+                length=None,
+                nullable=False,
+                primary_key=True,
+                unique=True,
+            )
+        ],
+    )
+
+    # Colonnes ajoutées
+    for column in (
+        ColumnMeta(
+            name="Closed",
+            type=ColumnType.BOOLEAN,
+            length=None,
+            nullable=False,
+            primary_key=False,
+            unique=False,
+            default=False,
+        ),
+        ColumnMeta(
+            name="Code",
+            type=ColumnType.VARCHAR,
+            length=10,
+            nullable=False,
+            primary_key=False,
+            unique=False,
+            default="abc",
+        ),
+    ):
+        added = table.add_column(column)
+        assert added.meta == column
+        assert table.get_column(column.name) is added
+
+    # Colonne TEXT de longueur donnée, stockée en VARCHAR
+    added = table.add_column(
+        ColumnMeta(
+            name="Country",
+            type=ColumnType.TEXT,
+            length=100,
+            nullable=False,
+            primary_key=False,
+            unique=False,
+        )
+    )
+    assert added.meta.type == ColumnType.VARCHAR
+    orm.close_session()
+
+
+def test_shared_reflection_keeps_instances_apart(tmp_path: Path) -> None:
+    """
+    ÉTANT DONNÉ deux instances partageant la réflexion d'une même base,
+    QUAND l'une ajoute une colonne puis est fermée,
+    ALORS l'autre garde son moteur et ses métadonnées, et une nouvelle instance
+    réfléchit la colonne ajoutée.
+    """
+
+    # Instances
+    engine_url = f"sqlite:///{tmp_path / 'shared.db'}"
+    SQLAlchemy(engine_url, "").create_table(
+        "Schools",
+        [
+            ColumnMeta(
+                name="Id",
+                type=ColumnType.INT,
+                length=None,
+                nullable=False,
+                primary_key=True,
+                unique=True,
+            )
+        ],
+    )
+    first, second = (
+        SQLAlchemy(engine_url, "", share_reflection=True),
+        SQLAlchemy(engine_url, "", share_reflection=True),
+    )
+    assert first.engine is not second.engine
+    assert first.get_table("Schools") is not second.get_table("Schools")
+
+    # Colonne ajoutée puis fermeture de la première instance
+    first.get_table("Schools").add_column(
+        ColumnMeta(
+            name="Code",
+            type=ColumnType.VARCHAR,
+            length=10,
+            nullable=True,
+            primary_key=False,
+            unique=False,
+        )
+    )
+    first.close_session()
+    assert list(second.get_table("Schools").columns) == ["Id"]
+    assert second.execute_query('SELECT COUNT(*) FROM "Schools"') == [(0,)]
+
+    # Nouvelle instance
+    third = SQLAlchemy(engine_url, "", share_reflection=True)
+    assert list(third.get_table("Schools").columns) == ["Id", "Code"]
+    for orm in (second, third):
+        orm.close_session()
+
+
+def test_shared_reflection_is_bounded(tmp_path: Path) -> None:
+    """
+    ÉTANT DONNÉ plus de bases partageant leur réflexion que de clichés
+    conservés,
+    QUAND une instance est créée pour chacune,
+    ALORS seuls les derniers clichés utilisés sont conservés.
+    """
+
+    # Instances
+    for index in range(_REFLECTION_SNAPSHOTS_MAXSIZE + 2):
+        SQLAlchemy(
+            f"sqlite:///{tmp_path / f'bounded_{index}.db'}", "", share_reflection=True
+        ).close_session()
+
+    # Clichés conservés
+    assert len(_REFLECTION_SNAPSHOTS) == _REFLECTION_SNAPSHOTS_MAXSIZE
+    assert (f"sqlite:///{tmp_path / 'bounded_0.db'}", None) not in _REFLECTION_SNAPSHOTS
+
+
+def test_rename_table_quotes_new_name(tmp_path: Path) -> None:
+    """
+    ÉTANT DONNÉ une table existante,
+    QUAND elle est renommée avec un nom contenant un guillemet,
+    ALORS le nom est échappé dans la requête et la table est retrouvée sous son
+    nouveau nom.
+    """
+
+    # Table
+    engine_url = f"sqlite:///{tmp_path / 'rename.db'}"
+    orm = SQLAlchemy(engine_url, "")
+    table = orm.create_table(
+        "Schools",
+        [
+            ColumnMeta(
+                name="Id",
+                type=ColumnType.INT,
+                length=None,
+                nullable=False,
+                primary_key=True,
+                unique=True,
+            )
+        ],
+    )
+
+    # Renommage
+    table.name = 'Old "Schools"'
+    assert orm.has_table('Old "Schools"')
+    assert not orm.has_table("Schools")
+    orm.close_session()
+    assert SQLAlchemy(engine_url, "").has_table('Old "Schools"')
+
+
+def test_get_tables_is_read_only_view(tmp_path: Path) -> None:
+    """
+    ÉTANT DONNÉ une base de données dont les tables sont réfléchies dans un
+    schéma,
+    QUAND ses tables sont récupérées,
+    ALORS elles sont indexées par leur nom sans le schéma, y compris une table
+    créée ensuite, et la vue ne peut pas être modifiée.
+    """
+
+    # Base de données
+    db_path = tmp_path / "tables.db"
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("CREATE TABLE Schools (Id INTEGER PRIMARY KEY)")
+    orm = SQLAlchemy(f"sqlite:///{db_path}", "main")
+    tables = orm.get_tables()
+
+    # Tables vues sans le schéma
+    assert list(tables) == ["Schools"]
+    assert "main.Schools" not in tables
+    assert tables["Schools"] is orm.get_table("Schools")
+    orm.create_table(
+        "Classes",
+        [
+            ColumnMeta(
+                name="Id",
+                type=ColumnType.INT,
+                length=None,
+                nullable=False,
+                primary_key=True,
+                unique=True,
+            )
+        ],
+    )
+    assert sorted(tables) == ["Classes", "Schools"]
+
+    # Vue en lecture seule
+    assert not hasattr(tables, "__setitem__")
+    assert not hasattr(tables, "__delitem__")
+    orm.close_session()
+
+
+def test_column_definition_for_request() -> None:
+    """
+    ÉTANT DONNÉ des colonnes nullable avec une valeur par défaut, unique, clé
+    primaire et clé étrangère,
+    QUAND leur définition SQL est construite pour un ajout de colonne,
+    ALORS chaque contrainte est écrite une seule fois, séparée par une espace.
+    """
+
+    definition = SQLAlchemy.Column._definition_for_request
+
+    # Colonne nullable avec une valeur par défaut
+    assert (
+        definition(
+            ColumnMeta(
+                name="Code",
+                type=ColumnType.VARCHAR,
+                length=10,
+                nullable=True,
+                primary_key=False,
+                unique=False,
+                default="l'abc",
+            ),
+            "VARCHAR(10)",
+            '"Schools"',
+        )
+        == "\"Code\" VARCHAR(10) DEFAULT 'l''abc'"
+    )
+
+    # Colonne unique non nullable
+    assert (
+        definition(
+            ColumnMeta(
+                name="Code",
+                type=ColumnType.VARCHAR,
+                length=10,
+                nullable=False,
+                primary_key=False,
+                unique=True,
+            ),
+            "VARCHAR(10)",
+            '"Schools"',
+        )
+        == '"Code" VARCHAR(10) NOT NULL UNIQUE'
+    )
+
+    # Colonne clé primaire avec une valeur par défaut
+    assert (
+        definition(
+            ColumnMeta(
+                name="Id",
+                type=ColumnType.INT,
+                length=None,
+                nullable=False,
+                primary_key=True,
+                unique=True,
+                default=5,
+            ),
+            "INTEGER",
+            '"Schools"',
+        )
+        == '"Id" INTEGER NOT NULL DEFAULT 5 PRIMARY KEY UNIQUE'
+    )
+
+    # Colonne clé étrangère
+    assert (
+        definition(
+            ForeignKeyColumnMeta(
+                name="SchoolId",
+                type=ColumnType.INT,
+                length=None,
+                nullable=False,
+                primary_key=False,
+                unique=False,
+                foreign_table_name="Schools",
+                foreign_column_name="Id",
+                on_delete=ForeignKeyAction.CASCADE,
+            ),
+            "INTEGER",
+            '"Schools"',
+        )
+        == '"SchoolId" INTEGER NOT NULL FOREIGN KEY ("SchoolId") REFERENCES'
+        ' "Schools" ("Id") ON DELETE CASCADE ON UPDATE NO ACTION'
+    )
+
+
+def test_table_name_for_request_quotes_schema(tmp_path: Path) -> None:
+    """
+    ÉTANT DONNÉ une table réfléchie dans un schéma,
+    QUAND une colonne lui est ajoutée puis qu'elle est renommée,
+    ALORS le schéma et la table sont entre guillemets dans les requêtes et le
+    nom est mis à jour au renommage.
+    """
+
+    # Table
+    db_path = tmp_path / "schema.db"
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("CREATE TABLE Schools (Id INTEGER PRIMARY KEY)")
+    orm = SQLAlchemy(f"sqlite:///{db_path}", "main")
+    table = orm.get_table("Schools")
+    assert table._table_name_for_request() == '"main"."Schools"'
+
+    # Ajout de colonne puis renommage
+    table.add_column(
+        ColumnMeta(
+            name="Code",
+            type=ColumnType.VARCHAR,
+            length=10,
+            nullable=True,
+            primary_key=False,
+            unique=False,
+        )
+    )
+    table.name = "Classes"
+    assert table._table_name_for_request() == '"main"."Classes"'
+    orm.close_session()
+
+    # Nouvelle lecture du schéma
+    orm = SQLAlchemy(f"sqlite:///{db_path}", "main")
+    assert list(orm.get_table("Classes").columns) == ["Id", "Code"]
+    orm.close_session()